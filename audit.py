@@ -0,0 +1,152 @@
+import json
+import mmap
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from main import FEEDBACK_MESSAGES, STRENGTH_LEVELS, PasswordGenerator
+from parallel import iter_bounded_results
+
+_worker_generator = None
+
+
+def _init_worker(breach_filter=None):
+    global _worker_generator
+    _worker_generator = PasswordGenerator(breach_filter=breach_filter)
+
+
+def iter_line_chunks(path, chunk_bytes=4 << 20):
+    size = os.path.getsize(path)
+    if not size:
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            end = data.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if end == -1 else end + 1
+            yield start, end
+            start = end
+
+
+def new_stats():
+    return {
+        "lines": 0,
+        "passwords": 0,
+        "strength": Counter(),
+        "score": Counter(),
+        "length": Counter(),
+        "feedback": Counter()
+    }
+
+
+def merge_stats(total, stats):
+    total["lines"] += stats["lines"]
+    total["passwords"] += stats["passwords"]
+    for key in ("strength", "score", "length", "feedback"):
+        total[key].update(stats[key])
+    return total
+
+
+def audit_lines(gen, lines):
+    indexes = array("I")
+    passwords = []
+
+    for index, line in enumerate(lines):
+        password = line.rstrip(b"\r").decode("utf-8", "replace")
+        if password:
+            indexes.append(index)
+            passwords.append(password)
+
+    batch = gen.check_passwords(passwords)
+    stats = new_stats()
+    stats["lines"] = len(lines)
+    stats["passwords"] = len(batch)
+    stats["score"].update(batch.scores)
+    stats["length"].update(batch.lengths)
+    for level, count in Counter(batch.levels).items():
+        stats["strength"][STRENGTH_LEVELS[level]] += count
+    for mask, count in Counter(batch.feedback_masks).items():
+        for i, message in enumerate(FEEDBACK_MESSAGES):
+            if mask >> i & 1:
+                stats["feedback"][message] += count
+
+    return (indexes, passwords, batch), stats
+
+
+def _audit_chunk(path, start, end):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        block = data[start:end]
+    if block.endswith(b"\n"):
+        block = block[:-1]
+    return audit_lines(_worker_generator, block.split(b"\n"))
+
+
+class PasswordAuditor:
+    def __init__(self, workers=1, chunk_bytes=4 << 20, breach_filter=None, max_pending=None):
+        self.workers = workers
+        self.chunk_bytes = chunk_bytes
+        self.breach_filter = breach_filter
+        self.max_pending = max_pending or workers * 2
+
+        if self.workers < 1:
+            raise ValueError("Need at least one worker")
+        if self.chunk_bytes < 1:
+            raise ValueError("Chunk size must be positive")
+
+    def iter_chunk_results(self, path):
+        tasks = ((_audit_chunk, path, start, end) for start, end in iter_line_chunks(path, self.chunk_bytes))
+
+        if self.workers == 1:
+            _init_worker(self.breach_filter)
+            for function, *args in tasks:
+                yield function(*args)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.breach_filter,)) as pool:
+            yield from iter_bounded_results(pool, tasks, self.max_pending)
+
+    def audit(self, path, out, output_format="jsonl"):
+        total = new_stats()
+
+        if output_format == "csv":
+            out.write("line,password,score,strength,length,feedback\n")
+
+        for (indexes, passwords, batch), stats in self.iter_chunk_results(path):
+            base = total["lines"] + 1
+            out.write(''.join(
+                format_audit_row(base + index, password, result, output_format)
+                for index, password, result in zip(indexes, passwords, batch)
+            ))
+            merge_stats(total, stats)
+
+        out.flush()
+        return total
+
+
+def format_audit_row(line, password, result, output_format):
+    if output_format == "csv":
+        password = password.replace('"', '""')
+        return (f'{line},"{password}",{result.score},{result.strength},{result.length},'
+                f'"{"; ".join(result.feedback)}"\n')
+    return json.dumps({
+        "line": line,
+        "password": password,
+        "score": result.score,
+        "strength": result.strength,
+        "length": result.length,
+        "feedback": result.feedback
+    }) + "\n"
+
+
+def summarize(stats):
+    return {
+        "lines": stats["lines"],
+        "passwords": stats["passwords"],
+        "strength": dict(stats["strength"].most_common()),
+        "score": dict(sorted(stats["score"].items())),
+        "length": dict(sorted(stats["length"].items())),
+        "feedback": dict(stats["feedback"].most_common())
+    }
@@ -0,0 +1,57 @@
+import argparse
+import os
+import secrets
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from breach import BloomFilter, build_bloom_filter
+
+
+def write_corpus(path, count):
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for _ in range(count):
+            f.write(secrets.token_urlsafe(9) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Breach filter build and lookup benchmark")
+    parser.add_argument("--items", type=int, default=1000000)
+    parser.add_argument("--fp-rate", type=float, default=0.001)
+    parser.add_argument("--lookups", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = os.path.join(directory, "corpus.txt")
+        output = os.path.join(directory, "corpus.pwbf")
+        write_corpus(corpus, args.items)
+
+        start = time.perf_counter()
+        build_bloom_filter(corpus, output, args.fp_rate, expected_items=args.items)
+        build_time = time.perf_counter() - start
+        print(f"build: {args.items:,} items in {build_time:.2f}s "
+              f"({args.items / build_time:,.0f} items/s), {os.path.getsize(output):,} bytes")
+
+        with open(corpus, encoding="utf-8") as f:
+            members = [line.rstrip("\n") for _, line in zip(range(args.lookups), f)]
+        strangers = [secrets.token_hex(8) for _ in range(args.lookups)]
+
+        with BloomFilter(output) as bloom:
+            start = time.perf_counter()
+            hits = sum(password in bloom for password in members)
+            member_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            false_positives = sum(password in bloom for password in strangers)
+            stranger_time = time.perf_counter() - start
+
+    lookups = len(members) + len(strangers)
+    print(f"lookup: {(member_time + stranger_time) / lookups * 1e6:.2f} us/lookup")
+    print(f"members found: {hits}/{len(members)}")
+    print(f"false positive rate: {false_positives / len(strangers):.5f} (target {args.fp_rate})")
+
+
+if __name__ == "__main__":
+    main()
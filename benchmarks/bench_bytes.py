@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator
+from sink import PasswordSink
+
+CONFIGURATIONS = {
+    "length 12": {"length": 12},
+    "length 16": {"length": 16},
+    "length 32": {"length": 32},
+    "length 8, 2 of each": {"length": 8, "min_uppercase": 2, "min_lowercase": 2, "min_digits": 2,
+                            "min_special": 2}
+}
+
+
+def str_path(gen, fd, count, chunk_size, options):
+    for start in range(0, count, chunk_size):
+        passwords = gen.generate_passwords(min(chunk_size, count - start), **options)
+        os.write(fd, ('\n'.join(passwords) + '\n').encode("utf-8"))
+
+
+def sink_path(gen, fd, count, chunk_size, options):
+    with PasswordSink(f"/dev/fd/{fd}", atomic=False) as sink:
+        sink.write_all(gen.generate_passwords(count, as_iterator=True, **options))
+
+
+def bytes_path(gen, fd, count, chunk_size, options):
+    for chunk in gen.iter_password_bytes(count, chunk_size, **options):
+        os.write(fd, chunk)
+
+
+def measure(function, gen, count, chunk_size, options, repeat):
+    best = float("inf")
+    with open(os.devnull, "wb") as devnull:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function(gen, devnull.fileno(), count, chunk_size, options)
+            best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare str and bytes-native bulk generation")
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=8192)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gen = PasswordGenerator()
+    paths = {"str + join": str_path, "str + sink": sink_path, "bytes": bytes_path}
+
+    print(f"{'configuration':<22}" + ''.join(f"{name:>14}" for name in paths) + f"{'speedup':>10}")
+    for name, options in CONFIGURATIONS.items():
+        rates = [measure(function, gen, args.count, args.chunk_size, options, args.repeat)
+                 for function in paths.values()]
+        print(f"{name:<22}" + ''.join(f"{rate:>14,.0f}" for rate in rates) + f"{rates[-1] / rates[0]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
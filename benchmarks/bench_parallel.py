@@ -0,0 +1,37 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parallel import ParallelGenerator
+
+
+def run(count, workers, chunk_size, length):
+    engine = ParallelGenerator(workers=workers, chunk_size=chunk_size)
+    start = time.perf_counter()
+    generated = 0
+    for chunk in engine.iter_chunks(count, "standard", ordered=False, length=length):
+        generated += len(chunk)
+    return generated / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel generation scaling benchmark")
+    parser.add_argument("--count", type=int, default=500000)
+    parser.add_argument("--length", type=int, default=16)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'workers':>8} {'passwords/s':>14} {'speedup':>8}")
+    for workers in range(1, args.max_workers + 1):
+        rate = run(args.count, workers, args.chunk_size, args.length)
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>14,.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
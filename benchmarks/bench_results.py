@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator, StrengthBatch
+
+
+def measure(label, build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>16}: {current / 1e6:8.1f} MB retained, {elapsed:6.2f}s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Strength result memory benchmark")
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--distinct", type=int, default=10000)
+    args = parser.parse_args()
+
+    gen = PasswordGenerator()
+    samples = gen.generate_passwords(args.distinct // 2, length=12)
+    samples += [gen.generate_memorable_password() for _ in range(args.distinct - len(samples))]
+    checked = [gen.check_password_strength(password) for password in samples]
+
+    def iter_results():
+        for i in range(args.count):
+            yield checked[i % len(checked)]
+
+    measure("dict", lambda: [result.to_dict() for result in iter_results()])
+    measure("StrengthResult", lambda: [type(result)(*(getattr(result, slot) for slot in result.__slots__))
+                                       for result in iter_results()])
+
+    def build_batch():
+        batch = StrengthBatch()
+        for result in iter_results():
+            batch.append(result)
+        return batch
+
+    measure("StrengthBatch", build_batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import RANDOM_BACKENDS, PasswordGenerator
+
+
+def measure(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return repeat / (time.perf_counter() - start)
+
+
+def run(backend, args):
+    gen = PasswordGenerator(random_backend=backend, seed=1 if backend == "seeded" else None)
+    source = gen.random
+    block = 1 << 16
+
+    return {
+        "randbytes MB/s": measure(lambda: source.randbytes(block), args.bytes_repeat) * block / 1e6,
+        "randbelow/s": measure(lambda: source.randbelow(1000), args.repeat),
+        "generate_password/s": measure(lambda: gen.generate_password(length=args.length), args.repeat // 10),
+        "generate_passwords/s": measure(lambda: gen.generate_passwords(1000, length=args.length),
+                                        max(1, args.repeat // 1000)) * 1000,
+        "complex_memorable/s": measure(lambda: gen.generate_complex_memorable_passwords(1000),
+                                       max(1, args.repeat // 1000)) * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare random backend throughput")
+    parser.add_argument("--repeat", type=int, default=50000)
+    parser.add_argument("--bytes-repeat", type=int, default=200)
+    parser.add_argument("--length", type=int, default=16)
+    args = parser.parse_args()
+
+    results = {backend: run(backend, args) for backend in RANDOM_BACKENDS}
+    metrics = list(results["system"])
+
+    print(f"{'metric':<24}" + ''.join(f"{backend:>14}" for backend in RANDOM_BACKENDS))
+    for metric in metrics:
+        print(f"{metric:<24}" + ''.join(f"{results[backend][metric]:>14,.0f}" for backend in RANDOM_BACKENDS))
+
+
+if __name__ == "__main__":
+    main()
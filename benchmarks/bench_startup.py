@@ -0,0 +1,63 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+gen = main.PasswordGenerator()
+constructed = time.perf_counter()
+gen.generate_password()
+first_password = time.perf_counter()
+gen.generate_memorable_password()
+first_memorable = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "construct_ms": (constructed - imported) * 1000,
+    "first_password_ms": (first_password - constructed) * 1000,
+    "first_memorable_ms": (first_memorable - first_password) * 1000,
+}))
+"""
+
+
+def probe():
+    output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time and first-password latency benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-import-ms", type=float, help="Fail if median import time exceeds this")
+    parser.add_argument("--max-first-password-ms", type=float,
+                        help="Fail if median import + first password time exceeds this")
+    args = parser.parse_args()
+
+    samples = [probe() for _ in range(args.runs)]
+    medians = {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+    for key, value in medians.items():
+        print(f"{key:>20}: {value:8.3f} ms")
+
+    failed = False
+    if args.max_import_ms is not None and medians["import_ms"] > args.max_import_ms:
+        print(f"Import time regression: {medians['import_ms']:.3f} ms > {args.max_import_ms} ms")
+        failed = True
+    total = medians["import_ms"] + medians["construct_ms"] + medians["first_password_ms"]
+    if args.max_first_password_ms is not None and total > args.max_first_password_ms:
+        print(f"First password regression: {total:.3f} ms > {args.max_first_password_ms} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator
+
+LENGTHS = (8, 12, 16, 32, 64, 128)
+OPTION_SETS = {
+    "default": {},
+    "no_special": {"use_special": False, "min_special": 0},
+    "letters_only": {"use_digits": False, "use_special": False, "min_digits": 0, "min_special": 0},
+    "no_ambiguous": {"exclude_ambiguous": True},
+    "high_minimums": {"min_uppercase": 2, "min_lowercase": 2, "min_digits": 2, "min_special": 2}
+}
+CUSTOM_TEMPLATES = {
+    "word_sep_number": [
+        {"type": "word", "config": {"min_length": 4, "max_length": 8, "capitalize": True}},
+        {"type": "separator", "options": ["-", "_", "."]},
+        {"type": "number", "config": {"min": 0, "max": 9999, "padding": 4}}
+    ],
+    "chars_heavy": [
+        {"type": "random_chars", "config": {"length": 12, "types": ["lowercase", "uppercase", "digits", "special"]}},
+        {"type": "separator"},
+        {"type": "random_chars", "config": {"length": 8, "types": ["digits"]}}
+    ],
+    "everything": [
+        {"type": "text", "value": "acct"},
+        {"type": "word", "config": {"random_case": True, "replacements": {"a": "4", "e": "3"}}},
+        {"type": "separator"},
+        {"type": "random_chars", "config": {"length": 6}},
+        {"type": "number", "config": {"min": 100, "max": 999}},
+        {"type": "word", "config": {"uppercase": True}}
+    ]
+}
+
+
+def build_cases(gen):
+    cases = {}
+
+    for length in LENGTHS:
+        for name, options in OPTION_SETS.items():
+            cases[f"generate_password/len{length}/{name}"] = (
+                lambda length=length, options=options: gen.generate_password(length=length, **options)
+            )
+
+    cases["generate_passwords/1000x16"] = lambda: gen.generate_passwords(1000, length=16)
+
+    cases["generate_memorable_password/default"] = gen.generate_memorable_password
+    cases["generate_memorable_password/6_words_plain"] = (
+        lambda: gen.generate_memorable_password(num_words=6, separator="", add_numbers=False)
+    )
+
+    cases["generate_complex_memorable_password/default"] = gen.generate_complex_memorable_password
+    cases["generate_complex_memorable_password/5_words_min30"] = (
+        lambda: gen.generate_complex_memorable_password(num_words=5, min_length=30)
+    )
+    cases["generate_complex_memorable_passwords/1000x5_min64"] = (
+        lambda: gen.generate_complex_memorable_passwords(1000, num_words=5, min_length=64)
+    )
+
+    for level in range(1, 11):
+        cases[f"generate_password_by_complexity/{level}"] = (
+            lambda level=level: gen.generate_password_by_complexity(level)
+        )
+
+    for name, components in CUSTOM_TEMPLATES.items():
+        cases[f"build_custom_password/{name}"] = (
+            lambda components=components: gen.build_custom_password(components)
+        )
+
+    samples = gen.generate_passwords(500, length=16)
+    samples += [gen.generate_memorable_password() for _ in range(500)]
+    samples += ["password123", "qwerty", "aaaaaaa", "Tr0ub4dor&3", "correcthorsebatterystaple"]
+    cases["check_password_strength/mixed"] = cycle_call(gen.check_password_strength, samples)
+
+    return cases
+
+
+def cycle_call(function, samples):
+    state = {"index": 0}
+
+    def call():
+        index = state["index"]
+        state["index"] = (index + 1) % len(samples)
+        return function(samples[index])
+
+    return call
+
+
+def run_case(function, iterations, warmup, memory_iterations):
+    for _ in range(warmup):
+        function()
+
+    timings = []
+    perf_counter_ns = time.perf_counter_ns
+    start = perf_counter_ns()
+    for _ in range(iterations):
+        call_start = perf_counter_ns()
+        function()
+        timings.append(perf_counter_ns() - call_start)
+    total = perf_counter_ns() - start
+
+    tracemalloc.start()
+    for _ in range(memory_iterations):
+        function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": iterations / (total / 1e9),
+        "p50_us": timings[len(timings) // 2] / 1000,
+        "p99_us": timings[min(len(timings) - 1, int(len(timings) * 0.99))] / 1000,
+        "mean_us": statistics.fmean(timings) / 1000,
+        "peak_memory_kb": peak / 1024
+    }
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    print(f"\n{'case':<58} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        change = result["ops_per_sec"] / previous["ops_per_sec"] - 1
+        marker = " !" if change < -threshold else ""
+        print(f"{name:<58} {previous['ops_per_sec']:>12,.0f} {result['ops_per_sec']:>12,.0f} "
+              f"{change:>+7.1%}{marker}")
+        if change < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PasswordGenerator benchmark suite")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--memory-iterations", type=int, default=100)
+    parser.add_argument("--filter", help="Only run cases containing this text")
+    parser.add_argument("--output", help="Save results as JSON")
+    parser.add_argument("--baseline", help="Compare against a previously saved JSON run")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative ops/sec drop that counts as a regression")
+    args = parser.parse_args()
+
+    gen = PasswordGenerator()
+    results = {}
+
+    print(f"{'case':<58} {'ops/sec':>12} {'p50 us':>9} {'p99 us':>9} {'peak KB':>9}")
+    for name, function in build_cases(gen).items():
+        if args.filter and args.filter not in name:
+            continue
+        bulk = name.startswith(("generate_passwords/", "generate_complex_memorable_passwords/"))
+        iterations = max(1, args.iterations // 100) if bulk else args.iterations
+        result = run_case(function, iterations, args.warmup, args.memory_iterations)
+        results[name] = result
+        print(f"{name:<58} {result['ops_per_sec']:>12,.0f} {result['p50_us']:>9.1f} "
+              f"{result['p99_us']:>9.1f} {result['peak_memory_kb']:>9.1f}")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
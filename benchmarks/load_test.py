@@ -0,0 +1,143 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "health": ("GET", "/health", None),
+    "generate": ("POST", "/generate", {"type": "standard", "options": {"length": 16}}),
+    "memorable": ("POST", "/generate", {"type": "memorable", "options": {"num_words": 4}}),
+    "custom": ("POST", "/generate", {"type": "custom", "components": [
+        {"type": "word", "config": {"capitalize": True}},
+        {"type": "separator"},
+        {"type": "number", "config": {"min": 0, "max": 999, "padding": 3}}
+    ]}),
+    "check": ("POST", "/check", {"password": "Tr0ub4dor&3"}),
+    "bulk": ("POST", "/generate/bulk", {"type": "standard", "count": 10000, "options": {"length": 16}})
+}
+
+
+async def open_connection(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def request(reader, writer, method, path, payload):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n"
+                 .encode("latin-1") + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    received = 0
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int(await reader.readline(), 16)
+            received += len(await reader.readexactly(size + 2)) - 2
+            if not size:
+                break
+    else:
+        received = len(await reader.readexactly(int(headers.get("content-length", 0))))
+
+    if status != 200:
+        raise RuntimeError(f"{method} {path} returned {status}")
+    return received
+
+
+async def client(args, scenario, deadline, timings, totals):
+    method, path, payload = SCENARIOS[scenario]
+    reader, writer = await open_connection(args)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter_ns()
+            totals["bytes"] += await request(reader, writer, method, path, payload)
+            timings.append(time.perf_counter_ns() - start)
+    finally:
+        writer.close()
+
+
+async def run_scenario(args, scenario):
+    timings = []
+    totals = {"bytes": 0}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(client(args, scenario, deadline, timings, totals)
+                           for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    timings.sort()
+    return {
+        "requests": len(timings),
+        "requests_per_sec": len(timings) / elapsed,
+        "mb_per_sec": totals["bytes"] / elapsed / 1e6,
+        "p50_ms": timings[len(timings) // 2] / 1e6 if timings else 0.0,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] / 1e6 if timings else 0.0,
+        "mean_ms": statistics.fmean(timings) / 1e6 if timings else 0.0
+    }
+
+
+async def wait_for_server(args, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            reader, writer = await open_connection(args)
+            await request(reader, writer, "GET", "/health", None)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def run(args):
+    await wait_for_server(args)
+    print(f"{'scenario':<12} {'requests':>9} {'req/s':>10} {'MB/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for scenario in args.scenarios:
+        result = await run_scenario(args, scenario)
+        print(f"{scenario:<12} {result['requests']:>9} {result['requests_per_sec']:>10,.0f} "
+              f"{result['mb_per_sec']:>8.2f} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the local generation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", help="Connect to this Unix socket instead of TCP")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per scenario")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--spawn", action="store_true", help="Start 'main.py serve' for the run")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        command = [sys.executable, os.path.join(ROOT, "main.py"), "serve"]
+        command += ["--unix", args.unix] if args.unix else ["--host", args.host, "--port", str(args.port)]
+        server = subprocess.Popen(command)
+
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
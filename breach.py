@@ -0,0 +1,98 @@
+import hashlib
+import math
+import mmap
+import struct
+
+MAGIC = b"PWBF"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQd")
+
+
+def optimal_parameters(expected_items, false_positive_rate):
+    if expected_items < 1:
+        expected_items = 1
+    if not 0 < false_positive_rate < 1:
+        raise ValueError("False positive rate must be between 0 and 1")
+
+    num_bits = math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+    num_bits = max(64, (num_bits + 7) // 8 * 8)
+    num_hashes = max(1, round(num_bits / expected_items * math.log(2)))
+    return num_bits, num_hashes
+
+
+def hash_pair(password):
+    if isinstance(password, str):
+        password = password.encode("utf-8", "surrogateescape")
+    digest = hashlib.blake2b(password, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+def iter_corpus(corpus_path):
+    with open(corpus_path, "rb") as f:
+        for line in f:
+            line = line.rstrip(b"\r\n")
+            if line:
+                yield line
+
+
+def build_bloom_filter(corpus_path, output_path, false_positive_rate=0.001, expected_items=None):
+    if expected_items is None:
+        expected_items = sum(1 for _ in iter_corpus(corpus_path))
+
+    num_bits, num_hashes = optimal_parameters(expected_items, false_positive_rate)
+    bits = bytearray(num_bits // 8)
+    added = 0
+
+    for password in iter_corpus(corpus_path):
+        first, step = hash_pair(password)
+        for i in range(num_hashes):
+            index = (first + i * step) % num_bits
+            bits[index >> 3] |= 1 << (index & 7)
+        added += 1
+
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, num_hashes, num_bits, added, false_positive_rate))
+        f.write(bits)
+
+    return added
+
+
+class BloomFilter:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.num_hashes, self.num_bits, self.item_count,
+         self.false_positive_rate) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a breach filter file: {path}")
+        if version != VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported breach filter version: {version}")
+
+        self.path = path
+        self._offset = HEADER.size
+
+    def __contains__(self, password):
+        first, step = hash_pair(password)
+        bits = self._map
+        offset = self._offset
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            index = (first + i * step) % num_bits
+            if not bits[offset + (index >> 3)] & (1 << (index & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.item_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._map.close()
@@ -0,0 +1,339 @@
+import json
+import math
+from collections import defaultdict
+from functools import lru_cache
+from itertools import product
+from typing import Dict, NamedTuple, Optional
+
+from main import (COMPLEX_WORD_TRANSFORMS, LEET_TABLES, PADDING_CHARS, PLAIN_SEPARATORS,
+                  SPECIAL_SEPARATORS)
+
+MAX_CASE_VARIANTS = 1 << 16
+
+
+class GeneratorEntropy(NamedTuple):
+    bits: float
+    min_bits: float
+    exact: bool
+    outcomes: Optional[int] = None
+
+
+class Distribution(NamedTuple):
+    bits: float
+    lengths: Dict[int, float]
+    min_bits: Dict[int, float]
+    outcomes: int
+    exact: bool = True
+
+    @property
+    def fixed_length(self):
+        return len(self.lengths) == 1
+
+    def result(self):
+        return GeneratorEntropy(self.bits, min(self.min_bits.values()), self.exact,
+                                self.outcomes if self.exact else None)
+
+
+def constant(text):
+    return Distribution(0.0, {len(text): 1.0}, {len(text): 0.0}, 1)
+
+
+def uniform(count, length):
+    bits = math.log2(count)
+    return Distribution(bits, {length: 1.0}, {length: bits}, count)
+
+
+def from_outcomes(outcomes):
+    bits = 0.0
+    lengths = defaultdict(float)
+    peaks = {}
+    for text, p in outcomes.items():
+        bits -= p * math.log2(p)
+        lengths[len(text)] += p
+        peaks[len(text)] = max(peaks.get(len(text), 0.0), p)
+    return Distribution(bits, dict(lengths), {length: -math.log2(p) for length, p in peaks.items()},
+                        len(outcomes))
+
+
+def concatenate(left, right, separable=False):
+    lengths = defaultdict(float)
+    min_bits = {}
+    for a, pa in left.lengths.items():
+        for b, pb in right.lengths.items():
+            lengths[a + b] += pa * pb
+            bits = left.min_bits[a] + right.min_bits[b]
+            if bits < min_bits.get(a + b, math.inf):
+                min_bits[a + b] = bits
+    exact = left.exact and right.exact and (separable or left.fixed_length or right.fixed_length)
+    return Distribution(left.bits + right.bits, dict(lengths), min_bits, left.outcomes * right.outcomes, exact)
+
+
+def number_outcomes(min_val, max_val, padding):
+    lengths = defaultdict(int)
+    for digits in range(1, len(str(max(abs(min_val), abs(max_val)))) + 1):
+        low, high = 10 ** (digits - 1) if digits > 1 else 0, 10 ** digits - 1
+        positive = max(0, min(high, max_val) - max(low, min_val) + 1)
+        negative = max(0, min(high, -min_val) - max(max(low, 1), -max_val) + 1)
+        lengths[max(digits, padding)] += positive
+        lengths[max(digits + 1, padding)] += negative
+    return {length: count for length, count in lengths.items() if count}
+
+
+def uniform_numbers(min_val, max_val, padding=0):
+    span = max_val - min_val + 1
+    bits = math.log2(span)
+    lengths = number_outcomes(min_val, max_val, padding)
+    return Distribution(bits, {length: count / span for length, count in lengths.items()},
+                        {length: bits for length in lengths}, span)
+
+
+def leet_outcomes(word, p):
+    outcomes = {word: p * 2 / 3}
+    lowered = word.lower()
+    remaining = p / 3
+    for letter, table in LEET_TABLES:
+        if letter in lowered:
+            remaining /= 2
+            replaced = word.translate(table)
+            outcomes[replaced] = outcomes.get(replaced, 0.0) + remaining
+    outcomes[word] += remaining
+    return outcomes
+
+
+def replace_all(text, replacements):
+    for old, new in replacements:
+        text = text.replace(old, new)
+    return text
+
+
+def case_outcomes(char, replacements):
+    return frozenset(replace_all(text, replacements) for text in (char.upper(), char.lower()))
+
+
+def case_distribution(groups, p, exact=True):
+    bits = 0.0
+    lengths = defaultdict(float)
+    min_bits = {}
+    count = 0
+    for length, cased, size in groups:
+        q = size * p
+        surprise = cased - math.log2(q)
+        bits += q * surprise
+        lengths[length] += q
+        min_bits[length] = min(min_bits.get(length, math.inf), surprise)
+        count += 1 << cased
+    return Distribution(bits, dict(lengths), min_bits, count, exact)
+
+
+def random_case_distribution(words, replacements):
+    p = 1 / len(words)
+    positions = {}
+    owners = {}
+    keys = defaultdict(int)
+    per_position = all(len(old) == 1 for old, _ in replacements)
+
+    for word in words:
+        key = []
+        for char in word:
+            outputs = positions.get(char)
+            if outputs is None:
+                outputs = positions[char] = case_outcomes(char, replacements)
+                for text in outputs:
+                    if len(text) != 1 or owners.setdefault(text, outputs) != outputs:
+                        per_position = False
+            key.append(outputs)
+        keys[tuple(key)] += 1
+
+    if per_position:
+        return case_distribution(((len(key), sum(len(outputs) - 1 for outputs in key), size)
+                                  for key, size in keys.items()), p)
+
+    if sum(1 << len(word) for word in words) <= MAX_CASE_VARIANTS:
+        outcomes = defaultdict(float)
+        for word in words:
+            variants = [replace_all(''.join(chars), replacements)
+                        for chars in product(*((char.upper(), char.lower()) for char in word))]
+            for text in variants:
+                outcomes[text] += p / len(variants)
+        return from_outcomes(outcomes)
+
+    return case_distribution(((len(replace_all(word.lower(), replacements)),
+                               sum(len(positions[char]) - 1 for char in word), 1) for word in words), p, exact=False)
+
+
+class EntropyCalculator:
+    def __init__(self, generator, cache_size=1024):
+        self.generator = generator
+        self._entropy = lru_cache(maxsize=cache_size)(self._compute)
+        self.word_distribution = lru_cache(maxsize=64)(self._word_distribution)
+
+    def entropy(self, kind="standard", **options):
+        if kind == "custom":
+            components = options.get("components", [])
+            if isinstance(components, str):
+                return self._entropy(kind, ("template", components))
+            return self._entropy(kind, ("json", json.dumps(components, sort_keys=True)))
+        return self._entropy(kind, tuple(sorted(options.items())))
+
+    def _compute(self, kind, key):
+        if kind == "custom":
+            source, components = key
+            return self.custom(components if source == "template" else json.loads(components))
+        options = dict(key)
+        if kind == "standard":
+            return self.standard(**options)
+        if kind == "complexity":
+            return self.standard(**self.generator.get_complexity_options(**options))
+        if kind == "memorable":
+            return self.memorable(**options)
+        if kind == "complex":
+            return self.complex_memorable(**options)
+        raise ValueError(f"Unknown password type '{kind}'")
+
+    def standard(self, length=12, **options):
+        sampler = self.generator.get_password_sampler(length, **options)
+        return GeneratorEntropy(sampler.entropy_bits, sampler.entropy_bits, True, sampler.count)
+
+    def words(self, min_length, max_length):
+        gen = self.generator
+        if not gen._word_generator_ready:
+            gen.init_word_generator()
+        if gen.word_generator is not None:
+            raise ValueError(f"Entropy is unknown for the '{gen.word_backend}' word backend, "
+                             f"use an offline wordlist")
+
+        index = gen.word_index
+        if index.count(min_length, max_length):
+            return [word for word in index if min_length <= len(word) <= max_length]
+        return list(index)
+
+    def _word_distribution(self, min_length, max_length, mode, replacements=()):
+        words = self.words(min_length, max_length)
+        if not words:
+            raise ValueError("The wordlist is empty")
+        p = 1 / len(words)
+        outcomes = defaultdict(float)
+
+        if mode == "random_case":
+            return random_case_distribution(words, replacements)
+
+        for word in words:
+            if mode == "complex":
+                for transform in COMPLEX_WORD_TRANSFORMS:
+                    for text, q in leet_outcomes(transform(word), p / len(COMPLEX_WORD_TRANSFORMS)).items():
+                        outcomes[text] += q
+                continue
+
+            outcomes[replace_all(getattr(str, mode)(word) if mode else word, replacements)] += p
+
+        return from_outcomes(outcomes)
+
+    def memorable(self, num_words=4, separator="-", add_numbers=True, capitalize=True,
+                  word_min_length=3, word_max_length=8):
+        word = self.word_distribution(word_min_length, word_max_length, "capitalize" if capitalize else None)
+        words = self.words(word_min_length, word_max_length)
+        separable = bool(separator) and not any(char in w for w in words for char in separator)
+
+        result = constant("")
+        for i in range(num_words):
+            if i:
+                result = concatenate(result, constant(separator))
+            result = concatenate(result, word, separable)
+        if add_numbers:
+            result = concatenate(result, uniform(1000, 3))
+        return result.result()
+
+    def complex_memorable(self, num_words=3, add_special_chars=True, add_numbers=True,
+                          transform_words=True, min_length=16):
+        word = self.word_distribution(4, 8, "complex" if transform_words else None)
+        if add_special_chars:
+            separators = {sep: 1 / 6 for sep in PLAIN_SEPARATORS}
+            separators.update({sep: 1 / 8 for sep in SPECIAL_SEPARATORS})
+        else:
+            separators = {sep: 1 / 3 for sep in PLAIN_SEPARATORS}
+        separator = from_outcomes(separators)
+
+        result = constant("")
+        for i in range(num_words):
+            if i:
+                result = concatenate(result, separator)
+            result = concatenate(result, word)
+
+        if add_numbers:
+            positions = math.log2(3) if num_words else 0.0
+            number = uniform_numbers(0, 9998, 2)
+            number = Distribution(number.bits + positions, number.lengths,
+                                  {length: bits + positions for length, bits in number.min_bits.items()},
+                                  number.outcomes * (3 if num_words else 1))
+            result = concatenate(result, number)
+
+        if not add_special_chars:
+            return result.result()
+
+        bits = result.bits
+        min_bits = math.inf
+        exact = result.exact
+        for length, p in result.lengths.items():
+            padding = max(0, min_length - length)
+            padding_bits = math.log2(math.comb(length + padding, padding)) + padding * math.log2(len(PADDING_CHARS))
+            bits += p * padding_bits
+            min_bits = min(min_bits, result.min_bits[length] + padding_bits)
+            exact = exact and not padding
+        return GeneratorEntropy(bits, min_bits, exact, result.outcomes if exact else None)
+
+    def custom(self, components):
+        if isinstance(components, str):
+            from template import parse_template
+            components = parse_template(components)
+
+        result = constant("")
+        for component in components:
+            comp_type = component.get('type', 'text')
+
+            if comp_type == 'text':
+                part = constant(component.get('value', ''))
+            elif comp_type == 'word':
+                config = component.get('config', {})
+                if config.get('capitalize', False):
+                    mode = "capitalize"
+                elif config.get('uppercase', False):
+                    mode = "upper"
+                elif config.get('lowercase', False):
+                    mode = "lower"
+                elif config.get('random_case', False):
+                    mode = "random_case"
+                else:
+                    mode = None
+                part = self.word_distribution(config.get('min_length', 3), config.get('max_length', 10), mode,
+                                              tuple(config.get('replacements', {}).items()))
+            elif comp_type == 'random_chars':
+                config = component.get('config', {})
+                length = config.get('length', 4)
+                char_types = config.get('types', ['lowercase', 'uppercase', 'digits'])
+                plan = self.generator.get_charset_plan(
+                    use_uppercase='uppercase' in char_types,
+                    use_lowercase='lowercase' in char_types,
+                    use_digits='digits' in char_types,
+                    use_special='special' in char_types,
+                    min_uppercase=0, min_lowercase=0, min_digits=0, min_special=0
+                )
+                part = uniform(len(plan.pool) ** length, length) if plan.pool and length > 0 else constant("")
+            elif comp_type == 'number':
+                config = component.get('config', {})
+                min_val, max_val = config.get('min', 0), config.get('max', 9999)
+                if max_val < min_val:
+                    raise ValueError("Number range is empty")
+                part = uniform_numbers(min_val, max_val, config.get('padding', 0))
+            elif comp_type == 'separator':
+                options = component.get('options', ['-', '_', '.', '!', '@', '#'])
+                if not options:
+                    raise ValueError("Separator needs at least one option")
+                outcomes = defaultdict(float)
+                for option in options:
+                    outcomes[option] += 1 / len(options)
+                part = from_outcomes(outcomes)
+            else:
+                continue
+
+            result = concatenate(result, part)
+        return result.result()
@@ -0,0 +1,169 @@
+import math
+from bisect import bisect_left
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+LEET_TABLE = str.maketrans({"4": "a", "@": "a", "3": "e", "1": "i", "!": "i", "0": "o",
+                            "5": "s", "$": "s", "7": "t"})
+SEQUENCE_KINDS = ("digits", "letters", "keyboard", "keyboard", "keyboard")
+OTHER_CARDINALITY = 100
+
+
+class Segment(NamedTuple):
+    start: int
+    end: int
+    pattern: str
+    token: str
+    bits: float
+
+
+class EntropyEstimate(NamedTuple):
+    bits: float
+    segments: Tuple[Segment, ...]
+
+    @property
+    def guesses_log10(self):
+        return self.bits * math.log10(2)
+
+
+class EntropyEstimator:
+    def __init__(self, words, char_classes, sequences, sequence_kinds=SEQUENCE_KINDS,
+                 cache_size=65536):
+        self.words = frozenset(word.lower() for word in words)
+        self.sorted_words = tuple(sorted(self.words))
+        self.word_bits = math.log2(len(self.words)) if self.words else 0.0
+        self.min_word_length = min(map(len, self.words), default=0)
+        self.max_word_length = max(map(len, self.words), default=0)
+
+        self.cardinality = {}
+        for chars in char_classes:
+            for char in chars:
+                self.cardinality[char] = len(chars)
+
+        self.sequences = []
+        for row, kind in zip(sequences, sequence_kinds):
+            steps = {}
+            for i in range(1, len(row)):
+                steps[row[i - 1] + row[i]] = 1
+                steps.setdefault(row[i] + row[i - 1], -1)
+            self.sequences.append((len(row), kind, steps))
+
+        self.estimate = lru_cache(maxsize=cache_size)(self._estimate)
+        self.dictionary_bits = lru_cache(maxsize=cache_size)(self._dictionary_bits)
+
+    def _estimate(self, password):
+        n = len(password)
+        if not n:
+            return EntropyEstimate(0.0, ())
+
+        ending_at = [[] for _ in range(n + 1)]
+        for segment in self.find_matches(password):
+            ending_at[segment.end].append(segment)
+
+        best = [0.0] * (n + 1)
+        choice = [None] * (n + 1)
+        for end in range(1, n + 1):
+            char = password[end - 1]
+            char_bits = self.char_bits(char)
+            best[end] = best[end - 1] + char_bits
+            choice[end] = Segment(end - 1, end, "bruteforce", char, char_bits)
+            for segment in ending_at[end]:
+                bits = best[segment.start] + segment.bits
+                if bits < best[end]:
+                    best[end] = bits
+                    choice[end] = segment
+
+        segments = []
+        end = n
+        while end > 0:
+            segment = choice[end]
+            segments.append(segment)
+            end = segment.start
+        segments.reverse()
+        return EntropyEstimate(best[n], tuple(self._merge_bruteforce(segments)))
+
+    def char_bits(self, char):
+        return math.log2(self.cardinality.get(char, OTHER_CARDINALITY))
+
+    def find_matches(self, password):
+        lowered = password.lower()
+        matches = []
+        matches.extend(self._dictionary_matches(password, lowered))
+        matches.extend(self._repeat_matches(password))
+        matches.extend(self._sequence_matches(password, lowered))
+        return matches
+
+    def _is_prefix(self, token):
+        index = bisect_left(self.sorted_words, token)
+        return index < len(self.sorted_words) and self.sorted_words[index].startswith(token)
+
+    def _dictionary_matches(self, password, lowered):
+        if not self.words:
+            return
+        unleeted = lowered.translate(LEET_TABLE)
+        n = len(password)
+        for start in range(n):
+            longest = min(n, start + self.max_word_length)
+            for end in range(start + 1, longest + 1):
+                token = unleeted[start:end]
+                if token in self.words and end - start >= self.min_word_length:
+                    yield Segment(start, end, "dictionary", password[start:end],
+                                  self.dictionary_bits(password[start:end]))
+                elif not self._is_prefix(token):
+                    break
+
+    def _dictionary_bits(self, token):
+        lowered = token.lower()
+        substitutions = sum(a != b for a, b in zip(lowered, lowered.translate(LEET_TABLE)))
+        return self.word_bits + self._case_bits(token) + substitutions
+
+    @staticmethod
+    def _case_bits(token):
+        letters = [char for char in token if char.isalpha()]
+        upper = sum(char.isupper() for char in letters)
+        lower = len(letters) - upper
+        if upper == 0:
+            return 0.0
+        if lower == 0 or (upper == 1 and letters[0].isupper()):
+            return 1.0
+        variations = sum(math.comb(len(letters), k) for k in range(1, min(upper, lower) + 1))
+        return math.log2(variations)
+
+    def _repeat_matches(self, password):
+        n = len(password)
+        start = 0
+        while start < n:
+            end = start + 1
+            while end < n and password[end] == password[start]:
+                end += 1
+            if end - start >= 3:
+                bits = self.char_bits(password[start]) + math.log2(end - start)
+                yield Segment(start, end, "repeat", password[start:end], bits)
+            start = end
+
+    def _sequence_matches(self, password, lowered):
+        n = len(lowered)
+        for row_length, kind, steps in self.sequences:
+            start = 0
+            direction = 0
+            for i in range(1, n + 1):
+                step = steps.get(lowered[i - 1:i + 1], 0) if i < n else 0
+                if step and step == direction:
+                    continue
+                if direction and i - start >= 3:
+                    bits = math.log2(row_length) + math.log2(i - start) + (direction < 0)
+                    yield Segment(start, i, kind, password[start:i], bits)
+                start = i - 1
+                direction = step
+
+    @staticmethod
+    def _merge_bruteforce(segments):
+        merged = []
+        for segment in segments:
+            previous = merged[-1] if merged else None
+            if previous and previous.pattern == segment.pattern == "bruteforce":
+                merged[-1] = Segment(previous.start, segment.end, "bruteforce",
+                                     previous.token + segment.token, previous.bits + segment.bits)
+            else:
+                merged.append(segment)
+        return merged
@@ -1,32 +1,677 @@
+import json
+import math
+import os
 import random
 import string
 import secrets
 import re
-from typing import List, Optional, Dict, Any
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from fractions import Fraction
+from functools import lru_cache
+from itertools import product, zip_longest
+from operator import itemgetter
+from typing import List, Optional, Dict, Any, NamedTuple, Tuple
+
+
+@lru_cache(maxsize=None)
+def load_word_backend():
+    try:
+        from wonderwords import RandomWord
+        return "wonderwords", RandomWord
+    except ImportError:
+        pass
 
-try:
-    from wonderwords import RandomWords
+    try:
+        from random_word import RandomWords as RandomWord
+        return "random_word", RandomWord
+    except ImportError:
+        return None, None
+
+
+class SystemRandomSource(random.SystemRandom):
+    def randbelow(self, n):
+        return self._randbelow(n)
+
+
+class RandomSourceAdapter(random.Random):
+    def __init__(self, source):
+        self.source = source
+        super().__init__()
+
+    def seed(self, a=None, version=2):
+        pass
+
+    def random(self):
+        return self.source.random()
+
+    def getrandbits(self, k):
+        return self.source.getrandbits(k)
+
+    def randbelow(self, n):
+        return self._randbelow(n)
+
+
+RANDOM_BACKENDS = ("system", "stream", "seeded")
+
+
+def create_random_source(backend="system", seed=None):
+    if isinstance(backend, random.Random):
+        return backend if hasattr(backend, "randbelow") else RandomSourceAdapter(backend)
+    if backend == "system":
+        if seed is not None:
+            raise ValueError("The system backend cannot be seeded")
+        return SystemRandomSource()
+    if backend == "stream":
+        from rng import StreamRandomSource
+        return StreamRandomSource(seed)
+    if backend == "seeded":
+        from rng import SeededRandomSource
+        return SeededRandomSource(seed)
+    raise ValueError(f"Unknown random backend '{backend}'")
+
+
+class EntropyBuffer:
+    def __init__(self, block_size=65536, urandom=os.urandom):
+        self.block_size = block_size
+        self._urandom = urandom
+        self._block = b""
+        self._pos = 0
+        self._fetched = 0
+        self._tables = {}
+
+    @property
+    def consumed(self):
+        return self._fetched - len(self._block) + self._pos
+
+    def read(self, n):
+        if self._pos + n > len(self._block):
+            size = max(self.block_size, n)
+            self._block = self._block[self._pos:] + self._urandom(size)
+            self._fetched += size
+            self._pos = 0
+        data = self._block[self._pos:self._pos + n]
+        self._pos += n
+        return data
+
+    def unread(self, n):
+        if not 0 <= n <= self._pos:
+            raise ValueError("Cannot unread more bytes than were read")
+        self._pos -= n
+
+    def randbelow(self, n):
+        if n <= 0:
+            raise ValueError("Upper bound must be positive")
+        bits = (n - 1).bit_length()
+        size = (bits + 7) // 8
+        mask = (1 << bits) - 1
+        if size == 1:
+            while True:
+                if self._pos >= len(self._block):
+                    self._block = self._urandom(self.block_size)
+                    self._fetched += self.block_size
+                    self._pos = 0
+                value = self._block[self._pos] & mask
+                self._pos += 1
+                if value < n:
+                    return value
+        while True:
+            value = int.from_bytes(self.read(size), "big") & mask
+            if value < n:
+                return value
 
-    HAS_WONDERWORDS = True
-except ImportError:
-    HAS_WONDERWORDS = False
+    def choice(self, seq):
+        return seq[self.randbelow(len(seq))]
 
-try:
-    from random_word import RandomWords as RandomWord
+    def shuffle(self, items):
+        keys = memoryview(self.read(4 * len(items))).cast("I")
+        if len(set(keys)) == len(items):
+            items[:] = [item for _, item in sorted(zip(keys, items), key=itemgetter(0))]
+            return
+        for i in range(len(items) - 1, 0, -1):
+            j = self.randbelow(i + 1)
+            items[i], items[j] = items[j], items[i]
+
+    def sample_positions(self, length, k):
+        positions = list(range(length))
+        for i in range(k):
+            j = i + self.randbelow(length - i)
+            positions[i], positions[j] = positions[j], positions[i]
+        return positions[:k]
+
+    def choices(self, chars, k, table=None):
+        if k <= 0:
+            return ""
+        if table is None:
+            table = self._tables.get(chars)
+            if table is None:
+                table = self._tables[chars] = compile_index_table(chars)
+        if not table:
+            return ''.join(self.choice(chars) for _ in range(k))
+
+        return self.choices_bytes(k, table).decode("latin-1")
+
+    def choices_bytes(self, k, table):
+        translation, rejected = table
+        result = b""
+        while len(result) < k:
+            result += self.read(k - len(result)).translate(translation, rejected)
+        return result
+
+
+def compile_index_table(chars):
+    if not chars or len(chars) > 256 or any(ord(c) > 255 for c in chars):
+        return ()
+    size = len(chars)
+    limit = 256 - 256 % size
+    encoded = chars.encode("latin-1")
+    translation = bytes(encoded[b % size] if b < limit else 0 for b in range(256))
+    return translation, bytes(range(limit, 256))
+
+
+class CharsetPlan(NamedTuple):
+    classes: Tuple[Tuple[str, int], ...]
+    pool: str
+    required: int
+    class_tables: Tuple[Any, ...]
+    pool_table: Any
+
+
+@lru_cache(maxsize=256)
+def compile_charset_plan(lowercase, uppercase, digits, special_chars, ambiguous_chars,
+                         use_uppercase, use_lowercase, use_digits, use_special,
+                         exclude_ambiguous, min_uppercase, min_lowercase, min_digits,
+                         min_special):
+    if exclude_ambiguous:
+        lowercase, uppercase, digits = (
+            ''.join(c for c in chars if c not in ambiguous_chars)
+            for chars in (lowercase, uppercase, digits)
+        )
 
-    HAS_RANDOM_WORD = True
-except ImportError:
-    HAS_RANDOM_WORD = False
+    classes = []
+    if use_lowercase:
+        classes.append((lowercase, min_lowercase))
+    if use_uppercase:
+        classes.append((uppercase, min_uppercase))
+    if use_digits:
+        classes.append((digits, min_digits))
+    if use_special:
+        classes.append((special_chars, min_special))
+
+    pool = ''.join(chars for chars, _ in classes)
+    return CharsetPlan(
+        classes=tuple(classes),
+        pool=pool,
+        required=sum(minimum for _, minimum in classes),
+        class_tables=tuple(compile_index_table(chars) for chars, _ in classes),
+        pool_table=compile_index_table(pool)
+    )
 
 
-class PasswordGenerator:
+REJECTION_MIN_ACCEPTANCE = 0.25
+
+
+def count_constrained_passwords(sizes, minimums, length):
+    total = Fraction(0)
+    for deficient in product((False, True), repeat=len(sizes)):
+        free = sum(size for size, short in zip(sizes, deficient) if not short)
+        polynomial = {0: Fraction(1)}
+        for size, minimum, short in zip(sizes, minimums, deficient):
+            if not short:
+                continue
+            terms = {}
+            for degree, coefficient in polynomial.items():
+                for n in range(minimum):
+                    terms[degree + n] = terms.get(degree + n, 0) - coefficient * Fraction(size ** n, math.factorial(n))
+            polynomial = terms
+        for degree, coefficient in polynomial.items():
+            if degree <= length:
+                total += coefficient * math.perm(length, degree) * free ** (length - degree)
+    return int(total)
+
+
+class PasswordSampler:
+    def __init__(self, plan, length):
+        self.plan = plan
+        self.length = length
+        self.sizes = tuple(len(chars) for chars, _ in plan.classes)
+        self.minimums = tuple(max(0, minimum) for _, minimum in plan.classes)
+        self.cumulative = None
+
+        self.count = count_constrained_passwords(self.sizes, self.minimums, length)
+        self.entropy_bits = math.log2(self.count) if self.count else 0.0
+        self.acceptance = self.count / len(plan.pool) ** length if plan.pool else 0.0
+
+        self.checks = tuple((index, minimum) for index, minimum in enumerate(self.minimums) if minimum)
+        self.label_table = None
+        if plan.pool_table and self.acceptance >= REJECTION_MIN_ACCEPTANCE:
+            labels = {ord(char): index for index, (chars, _) in enumerate(plan.classes) for char in chars}
+            self.label_table = bytes(labels.get(b, 255) for b in range(256))
+
+    def composition_tables(self):
+        if self.cumulative is None:
+            ways = [1] + [0] * self.length
+            cumulative = []
+            for size, minimum in zip(reversed(self.sizes), reversed(self.minimums)):
+                previous = ways
+                ways = [0] * (self.length + 1)
+                tables = []
+                for k in range(self.length + 1):
+                    total = 0
+                    weights = []
+                    for n in range(minimum, k + 1):
+                        total += math.comb(k, n) * size ** n * previous[k - n]
+                        weights.append(total)
+                    ways[k] = total
+                    tables.append(weights)
+                cumulative.append(tables)
+            cumulative.reverse()
+            self.cumulative = cumulative
+        return self.cumulative
+
+    def sample(self, buffer):
+        if self.label_table is not None:
+            pool, pool_table, length = self.plan.pool, self.plan.pool_table, self.length
+            while True:
+                candidate = buffer.choices(pool, length, pool_table)
+                labels = candidate.encode("latin-1").translate(self.label_table)
+                if all(labels.count(index) >= minimum for index, minimum in self.checks):
+                    return candidate
+
+        tables = self.composition_tables()
+        remaining = self.length
+        password_chars = []
+        last = len(self.sizes) - 1
+        for index, ((chars, _), table) in enumerate(zip(self.plan.classes, self.plan.class_tables)):
+            if index == last:
+                n = remaining
+            else:
+                cumulative = tables[index][remaining]
+                n = self.minimums[index] + bisect_right(cumulative, buffer.randbelow(cumulative[-1]))
+            password_chars.extend(buffer.choices(chars, n, table))
+            remaining -= n
+
+        buffer.shuffle(password_chars)
+        return ''.join(password_chars)
+
+    def sample_bytes(self, buffer):
+        if self.label_table is not None:
+            while True:
+                candidate = buffer.choices_bytes(self.length, self.plan.pool_table)
+                labels = candidate.translate(self.label_table)
+                if all(labels.count(index) >= minimum for index, minimum in self.checks):
+                    return candidate
+
+        tables = self.composition_tables()
+        remaining = self.length
+        password = bytearray()
+        last = len(self.sizes) - 1
+        for index, table in enumerate(self.plan.class_tables):
+            if index == last:
+                n = remaining
+            else:
+                cumulative = tables[index][remaining]
+                n = self.minimums[index] + bisect_right(cumulative, buffer.randbelow(cumulative[-1]))
+            if n:
+                password += buffer.choices_bytes(n, table)
+            remaining -= n
+
+        buffer.shuffle(password)
+        return password
+
+    def fill(self, buffer, out, count, delimiter=b"\n"):
+        if not self.plan.pool.isascii():
+            raise ValueError("Bytes output needs an ASCII character set")
+
+        length = self.length
+        stride = length + len(delimiter)
+        end = count * stride
+        view = memoryview(out).cast("B")
+        if len(view) < end:
+            raise ValueError("Output buffer is too small")
+
+        position = 0
+        if self.label_table is None:
+            while position < end:
+                view[position:position + length] = self.sample_bytes(buffer)
+                view[position + length:position + stride] = delimiter
+                position += stride
+            return end
+
+        translation, rejected = self.plan.pool_table
+        label_table, checks = self.label_table, self.checks
+        expansion = 256 / (256 - len(rejected)) / self.acceptance
+        scale = 1
+        while position < end:
+            wanted = int((end - position) // stride * length * expansion) + length
+            raw = buffer.read(min(wanted, max(buffer.block_size, length)) * scale)
+            data = raw.translate(translation, rejected)
+            labels = data.translate(label_table)
+            count_labels = labels.count
+            used = 0
+            for offset in range(0, len(data) - length + 1, length):
+                used = offset + length
+                for index, minimum in checks:
+                    if count_labels(index, offset, offset + length) < minimum:
+                        break
+                else:
+                    view[position:position + length] = data[offset:offset + length]
+                    view[position + length:position + stride] = delimiter
+                    position += stride
+                    if position == end:
+                        break
+            buffer.unread(unused_raw_length(raw, len(data) - used, rejected))
+            scale = 1 if used else scale * 2
+        return end
+
+
+def unused_raw_length(raw, unused, rejected):
+    if not rejected:
+        return unused
+    limit = 256 - len(rejected)
+    end = len(raw)
+    size = found = 0
+    while found < unused:
+        step = min(end - size, (unused - found) * 256 // limit + 1)
+        found += len(raw[end - size - step:end - size].translate(None, rejected))
+        size += step
+    while found > unused:
+        if raw[end - size] < limit:
+            found -= 1
+        size -= 1
+    while size < end and raw[end - size - 1] >= limit:
+        size += 1
+    return size
+
+
+@lru_cache(maxsize=256)
+def compile_password_sampler(plan, length):
+    return PasswordSampler(plan, length)
+
+
+class WordIndex:
+    def __init__(self, words):
+        self.words = tuple(sorted(words, key=len))
+        self.max_length = len(self.words[-1]) if self.words else 0
+        self.offsets = [0] * (self.max_length + 2)
+
+        position = 0
+        for length in range(self.max_length + 2):
+            while position < len(self.words) and len(self.words[position]) < length:
+                position += 1
+            self.offsets[length] = position
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def _offset(self, length):
+        if length <= 0:
+            return 0
+        if length > self.max_length:
+            return len(self.words)
+        return self.offsets[length]
+
+    def count(self, min_length, max_length):
+        return max(0, self._offset(max_length + 1) - self._offset(min_length))
+
+    def choice(self, min_length, max_length, randbelow=secrets.randbelow):
+        start = self._offset(min_length)
+        size = self._offset(max_length + 1) - start
+        if size <= 0:
+            return None
+        return self.words[start + randbelow(size)]
+
+
+def capitalize_long_word(word):
+    return word.capitalize() if len(word) > 4 else word.upper()
+
+
+COMPLEX_WORD_TRANSFORMS = (str.capitalize, str.upper, str.lower, capitalize_long_word)
+LEET_TABLES = tuple(
+    (letter, str.maketrans({letter: digit, letter.upper(): digit}))
+    for letter, digit in (('a', '4'), ('e', '3'), ('i', '1'), ('o', '0'), ('s', '5'), ('t', '7'))
+)
+PLAIN_SEPARATORS = ('', '-', '_')
+SPECIAL_SEPARATORS = ('.', '!', '@', '#')
+PADDING_CHARS = "!@#$%^&*"
+
+SEQUENCE_ROWS = ("01234567890", string.ascii_lowercase, "qwertyuiop", "asdfghjkl", "zxcvbnm")
+COMMON_PASSWORDS = ("password", "123456", "qwerty", "admin", "login", "welcome")
+
+
+class PatternScan(NamedTuple):
+    has_lower: bool
+    has_upper: bool
+    has_digit: bool
+    has_special: bool
+    has_repeat: bool
+    has_sequence: bool
+    has_common: bool
+
+
+STRENGTH_LEVELS = ("Very Weak", "Weak", "Medium", "Strong", "Very Strong", "Excellent")
+FEEDBACK_MESSAGES = (
+    "Too short",
+    "Use different character types",
+    "Too many repeated characters",
+    "Avoid simple sequences",
+    "Avoid common passwords",
+    "Found in breached password lists"
+)
+(FEEDBACK_TOO_SHORT, FEEDBACK_CHAR_TYPES, FEEDBACK_REPEATED, FEEDBACK_SEQUENCES,
+ FEEDBACK_COMMON, FEEDBACK_BREACHED) = (1 << i for i in range(len(FEEDBACK_MESSAGES)))
+FLAG_LOWERCASE, FLAG_UPPERCASE, FLAG_DIGITS, FLAG_SPECIAL = 1, 2, 4, 8
+
+
+def strength_level(score):
+    if score >= 10:
+        return 5
+    elif score >= 8:
+        return 4
+    elif score >= 6:
+        return 3
+    elif score >= 4:
+        return 2
+    elif score >= 2:
+        return 1
+    return 0
+
+
+class StrengthResult(Mapping):
+    __slots__ = ("score", "level", "length", "flags", "unique_chars", "feedback_mask")
+    KEYS = ("score", "strength", "feedback", "length", "has_lowercase", "has_uppercase",
+            "has_digits", "has_special", "unique_chars")
+
+    def __init__(self, score, level, length, flags, unique_chars, feedback_mask):
+        self.score = score
+        self.level = level
+        self.length = length
+        self.flags = flags
+        self.unique_chars = unique_chars
+        self.feedback_mask = feedback_mask
+
+    @property
+    def strength(self):
+        return STRENGTH_LEVELS[self.level]
+
+    @property
+    def feedback(self):
+        return [message for i, message in enumerate(FEEDBACK_MESSAGES) if self.feedback_mask >> i & 1]
+
+    @property
+    def has_lowercase(self):
+        return bool(self.flags & FLAG_LOWERCASE)
+
+    @property
+    def has_uppercase(self):
+        return bool(self.flags & FLAG_UPPERCASE)
+
+    @property
+    def has_digits(self):
+        return bool(self.flags & FLAG_DIGITS)
+
+    @property
+    def has_special(self):
+        return bool(self.flags & FLAG_SPECIAL)
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return f"StrengthResult({self.to_dict()!r})"
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.KEYS}
+
+
+class StrengthBatch:
     def __init__(self):
+        self.scores = array("b")
+        self.levels = array("B")
+        self.lengths = array("I")
+        self.flags = array("B")
+        self.unique_chars = array("I")
+        self.feedback_masks = array("B")
+
+    def append(self, result):
+        self.scores.append(result.score)
+        self.levels.append(result.level)
+        self.lengths.append(result.length)
+        self.flags.append(result.flags)
+        self.unique_chars.append(result.unique_chars)
+        self.feedback_masks.append(result.feedback_mask)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __getitem__(self, index):
+        return StrengthResult(self.scores[index], self.levels[index], self.lengths[index],
+                              self.flags[index], self.unique_chars[index], self.feedback_masks[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class PatternScanner:
+    def __init__(self, special_chars, sequences=SEQUENCE_ROWS, common_passwords=COMMON_PASSWORDS):
+        self.special_chars = frozenset(special_chars)
+        self.following = {}
+
+        position = 0
+        for row in sequences:
+            for i in range(1, len(row)):
+                steps = self.following.setdefault(row[i - 1], {})
+                steps[row[i]] = steps.get(row[i], 0) | (1 << (position + i))
+            position += len(row)
+
+        self.common_pattern = re.compile(
+            '|'.join(re.escape(word.lower()) for word in common_passwords) or r'(?!)'
+        )
+
+    def scan(self, password):
+        has_lower = has_upper = has_digit = has_special = False
+        has_repeat = has_sequence = False
+        following = self.following
+        special_chars = self.special_chars
+        no_steps = {}
+
+        lowered = password.lower()
+        if len(lowered) == len(password):
+            chars = zip(password, lowered)
+        else:
+            chars = zip_longest(password, lowered, fillvalue="")
+
+        previous = None
+        previous_steps = 0
+        run = 0
+
+        for char, lowered_char in chars:
+            if char.islower():
+                has_lower = True
+            elif char.isupper():
+                has_upper = True
+            elif char.isdigit():
+                has_digit = True
+            elif char in special_chars:
+                has_special = True
+
+            if lowered_char == previous:
+                run += 1
+                if run >= 3:
+                    has_repeat = True
+                steps = 0
+            else:
+                run = 1
+                steps = following.get(previous, no_steps).get(lowered_char, 0)
+                if (previous_steps << 1) & steps:
+                    has_sequence = True
+
+            previous = lowered_char
+            previous_steps = steps
+
+        return PatternScan(
+            has_lower, has_upper, has_digit, has_special, has_repeat, has_sequence,
+            self.common_pattern.search(lowered) is not None
+        )
+
+
+@lru_cache(maxsize=8)
+def compile_pattern_scanner(special_chars):
+    return PatternScanner(special_chars)
+
+
+@lru_cache(maxsize=8)
+def fallback_word_index(words):
+    return WordIndex(words)
+
+
+INSTRUMENTED_METHODS = (
+    "get_random_word",
+    "generate_password",
+    "generate_passwords",
+    "generate_password_bytes",
+    "iter_password_bytes",
+    "generate_memorable_password",
+    "generate_complex_memorable_password",
+    "generate_complex_memorable_passwords",
+    "generate_password_by_complexity",
+    "build_custom_password",
+    "check_password_strength",
+    "check_passwords",
+    "estimate_entropy"
+)
+
+
+class PasswordGenerator:
+    def __init__(self, wordlist=None, breach_filter=None, random_backend="system", seed=None):
         self.lowercase = string.ascii_lowercase
         self.uppercase = string.ascii_uppercase
         self.digits = string.digits
         self.special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
         self.ambiguous_chars = "il1Lo0O"
         self.word_generator = None
+        self.word_backend = None
+        self.word_cache = None
+        self._word_generator_ready = False
+        self._entropy_estimator = None
+        self._entropy_calculator = None
+        self.random = create_random_source(random_backend, seed)
+        self.metrics = None
         self.fallback_words = [
             "apple", "mountain", "river", "sunset", "forest", "ocean", "thunder",
             "crystal", "dragon", "phoenix", "wizard", "castle", "garden", "rainbow",
@@ -38,82 +683,198 @@ class PasswordGenerator:
             "hammer", "blade", "arrow", "spear", "axe", "bow", "staff", "wand",
             "winter", "summer", "spring", "autumn", "frost", "blaze", "mist", "dawn"
         ]
-        self.init_word_generator()
+        self.breach_filter = breach_filter
+        if isinstance(breach_filter, str):
+            from breach import BloomFilter
+            self.breach_filter = BloomFilter(breach_filter)
+
+        if wordlist:
+            from wordlist import MappedWordList
+            self.word_index = MappedWordList(wordlist)
+            self._word_generator_ready = True
+        else:
+            self.word_index = fallback_word_index(tuple(self.fallback_words))
 
     def init_word_generator(self):
-        if HAS_WONDERWORDS:
-            try:
-                self.word_generator = RandomWords()
-            except:
-                pass
-        elif HAS_RANDOM_WORD:
-            try:
-                self.word_generator = RandomWord()
-            except:
-                pass
+        self._word_generator_ready = True
+        backend, backend_class = load_word_backend()
+        if backend_class is None:
+            return
+
+        try:
+            self.word_generator = backend_class()
+            self.word_backend = backend
+        except:
+            pass
+
+        if self.word_backend == "wonderwords" and hasattr(self.word_generator, "random_words"):
+            from wordcache import WordCache, wonderwords_fetcher
+            self.word_cache = WordCache(wonderwords_fetcher(self.word_generator))
+
+    def enable_metrics(self, metrics=None):
+        from metrics import CountingRandomSource, Metrics
+
+        self.disable_metrics()
+        self.metrics = metrics or Metrics()
+        self.random = CountingRandomSource(self.metrics, self.random)
+        for name in INSTRUMENTED_METHODS:
+            setattr(self, name, self.metrics.wrap(name, getattr(self, name)))
+        return self.metrics
+
+    def entropy_buffer(self, block_size=65536):
+        buffer = EntropyBuffer(block_size, self.random.randbytes)
+        if self.metrics is not None:
+            self.metrics.track(buffer)
+        return buffer
+
+    def disable_metrics(self):
+        for name in INSTRUMENTED_METHODS:
+            self.__dict__.pop(name, None)
+        if self.metrics is not None:
+            self.random = self.random.source
+        self.metrics = None
+
+    def get_random_word(self, min_length=3, max_length=10, randbelow=None):
+        if not self._word_generator_ready:
+            self.init_word_generator()
 
-    def get_random_word(self, min_length=3, max_length=10):
         if self.word_generator:
             try:
-                if HAS_WONDERWORDS:
-                    return self.word_generator.word(
-                        word_min_length=min_length,
-                        word_max_length=max_length
-                    )
-                elif HAS_RANDOM_WORD:
+                if self.word_backend == "wonderwords":
+                    if self.word_cache is not None:
+                        word = self.word_cache.choice(min_length, max_length, randbelow or self.random.randbelow)
+                    else:
+                        word = self.word_generator.word(
+                            word_min_length=min_length,
+                            word_max_length=max_length
+                        )
+                    if word:
+                        if self.metrics is not None:
+                            self.metrics.increment("word_backend_hits")
+                        return word
+                    if self.metrics is not None:
+                        self.metrics.increment("word_backend_rejects")
+                elif self.word_backend == "random_word":
                     word = self.word_generator.get_random_word()
                     if word and min_length <= len(word) <= max_length:
+                        if self.metrics is not None:
+                            self.metrics.increment("word_backend_hits")
                         return word
+                    if self.metrics is not None:
+                        self.metrics.increment("word_backend_rejects")
             except:
-                pass
+                if self.metrics is not None:
+                    self.metrics.increment("word_backend_errors")
 
-        suitable_words = [w for w in self.fallback_words if min_length <= len(w) <= max_length]
-        return secrets.choice(suitable_words) if suitable_words else secrets.choice(self.fallback_words)
+        if self.metrics is not None:
+            self.metrics.increment("word_fallback_hits")
+        randbelow = randbelow or self.random.randbelow
+        word = self.word_index.choice(min_length, max_length, randbelow)
+        if word is None:
+            word = self.word_index.choice(0, self.word_index.max_length, randbelow)
+        return word
 
     def generate_password(self, length=12, use_uppercase=True, use_lowercase=True,
                           use_digits=True, use_special=True, exclude_ambiguous=False,
                           min_uppercase=1, min_lowercase=1, min_digits=1, min_special=1):
+        sampler = self.get_password_sampler(length, use_uppercase, use_lowercase, use_digits,
+                                            use_special, exclude_ambiguous, min_uppercase,
+                                            min_lowercase, min_digits, min_special)
+        return sampler.sample(self.entropy_buffer(max(256, 2 * length)))
+
+    def generate_passwords(self, count, as_iterator=False, block_size=65536, length=12,
+                           use_uppercase=True, use_lowercase=True, use_digits=True,
+                           use_special=True, exclude_ambiguous=False, min_uppercase=1,
+                           min_lowercase=1, min_digits=1, min_special=1):
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        sampler = self.get_password_sampler(length, use_uppercase, use_lowercase, use_digits,
+                                            use_special, exclude_ambiguous, min_uppercase,
+                                            min_lowercase, min_digits, min_special)
+
+        buffer = self.entropy_buffer(block_size)
+        passwords = (sampler.sample(buffer) for _ in range(count))
+        return passwords if as_iterator else list(passwords)
+
+    def generate_password_bytes(self, count, out=None, delimiter=b"\n", block_size=65536, **options):
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        sampler = self.get_password_sampler(**options)
+        if out is None:
+            out = bytearray(count * (sampler.length + len(delimiter)))
+        sampler.fill(self.entropy_buffer(block_size), out, count, delimiter)
+        return out
+
+    def iter_password_bytes(self, count, chunk_size=8192, delimiter=b"\n", block_size=65536, **options):
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        sampler = self.get_password_sampler(**options)
+        buffer = self.entropy_buffer(block_size)
+        stride = sampler.length + len(delimiter)
+        for start in range(0, count, chunk_size):
+            size = min(chunk_size, count - start)
+            out = bytearray(size * stride)
+            sampler.fill(buffer, out, size, delimiter)
+            yield out
+
+    def get_password_sampler(self, length=12, use_uppercase=True, use_lowercase=True,
+                             use_digits=True, use_special=True, exclude_ambiguous=False,
+                             min_uppercase=1, min_lowercase=1, min_digits=1, min_special=1):
+        plan = self._checked_charset_plan(length, use_uppercase, use_lowercase, use_digits,
+                                          use_special, exclude_ambiguous, min_uppercase,
+                                          min_lowercase, min_digits, min_special)
+        return compile_password_sampler(plan, length)
+
+    def get_charset_plan(self, use_uppercase=True, use_lowercase=True, use_digits=True,
+                         use_special=True, exclude_ambiguous=False, min_uppercase=1,
+                         min_lowercase=1, min_digits=1, min_special=1):
+        return compile_charset_plan(
+            self.lowercase, self.uppercase, self.digits, self.special_chars,
+            self.ambiguous_chars, use_uppercase, use_lowercase, use_digits, use_special,
+            exclude_ambiguous, min_uppercase, min_lowercase, min_digits, min_special
+        )
+
+    def get_pattern_scanner(self):
+        return compile_pattern_scanner(self.special_chars)
+
+    def get_entropy_estimator(self):
+        if self._entropy_estimator is None:
+            from estimator import EntropyEstimator
+            self._entropy_estimator = EntropyEstimator(
+                self.word_index,
+                (self.lowercase, self.uppercase, self.digits, self.special_chars),
+                SEQUENCE_ROWS
+            )
+        return self._entropy_estimator
+
+    def estimate_entropy(self, password):
+        return self.get_entropy_estimator().estimate(password)
+
+    def get_entropy_calculator(self):
+        if self._entropy_calculator is None:
+            from entropy import EntropyCalculator
+            self._entropy_calculator = EntropyCalculator(self)
+        return self._entropy_calculator
+
+    def password_entropy(self, kind="standard", **options):
+        return self.get_entropy_calculator().entropy(kind, **options)
+
+    def _checked_charset_plan(self, length, *options):
         if length < 4:
             raise ValueError("Password too short")
 
-        char_pool = ""
-        required_chars = []
-
-        if use_lowercase:
-            chars = self.lowercase
-            if exclude_ambiguous:
-                chars = ''.join(c for c in chars if c not in self.ambiguous_chars)
-            char_pool += chars
-            required_chars.extend(secrets.choice(chars) for _ in range(min_lowercase))
-
-        if use_uppercase:
-            chars = self.uppercase
-            if exclude_ambiguous:
-                chars = ''.join(c for c in chars if c not in self.ambiguous_chars)
-            char_pool += chars
-            required_chars.extend(secrets.choice(chars) for _ in range(min_uppercase))
-
-        if use_digits:
-            chars = self.digits
-            if exclude_ambiguous:
-                chars = ''.join(c for c in chars if c not in self.ambiguous_chars)
-            char_pool += chars
-            required_chars.extend(secrets.choice(chars) for _ in range(min_digits))
-
-        if use_special:
-            char_pool += self.special_chars
-            required_chars.extend(secrets.choice(self.special_chars) for _ in range(min_special))
-
-        if not char_pool:
+        plan = self.get_charset_plan(*options)
+
+        if not plan.pool:
             raise ValueError("No character types selected")
 
-        if len(required_chars) > length:
+        if plan.required > length:
             raise ValueError("Requirements exceed password length")
 
-        remaining_length = length - len(required_chars)
-        password_chars = required_chars + [secrets.choice(char_pool) for _ in range(remaining_length)]
-        secrets.SystemRandom().shuffle(password_chars)
-        return ''.join(password_chars)
+        return plan
 
     def generate_memorable_password(self, num_words=4, separator="-", add_numbers=True,
                                     capitalize=True, word_min_length=3, word_max_length=8):
@@ -128,66 +889,89 @@ class PasswordGenerator:
         password = separator.join(selected_words)
 
         if add_numbers:
-            password += str(secrets.randbelow(1000)).zfill(3)
+            password += str(self.random.randbelow(1000)).zfill(3)
 
         return password
 
     def generate_complex_memorable_password(self, num_words=3, add_special_chars=True,
                                             add_numbers=True, transform_words=True, min_length=16):
-        words = []
-        for _ in range(num_words):
-            word = self.get_random_word(4, 8)
+        buffer = self.entropy_buffer(256)
+        return self._complex_memorable_password(buffer, num_words, add_special_chars,
+                                                add_numbers, transform_words, min_length)
+
+    def generate_complex_memorable_passwords(self, count, as_iterator=False, block_size=65536,
+                                             num_words=3, add_special_chars=True, add_numbers=True,
+                                             transform_words=True, min_length=16):
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        buffer = self.entropy_buffer(block_size)
+        passwords = (
+            self._complex_memorable_password(buffer, num_words, add_special_chars, add_numbers,
+                                             transform_words, min_length)
+            for _ in range(count)
+        )
+        return passwords if as_iterator else list(passwords)
+
+    def generate_unique_passwords(self, count, kind="standard", as_iterator=False, strict=False, **options):
+        from unique import unique_passwords
+        passwords = unique_passwords(self, kind, count, options, strict=strict)
+        return passwords if as_iterator else list(passwords)
+
+    def _complex_memorable_password(self, rng, num_words, add_special_chars, add_numbers,
+                                    transform_words, min_length):
+        parts = []
+        length = 0
+        for i in range(num_words):
+            if i:
+                if add_special_chars and rng.randbelow(2) == 0:
+                    separator = rng.choice(SPECIAL_SEPARATORS)
+                else:
+                    separator = rng.choice(PLAIN_SEPARATORS)
+                parts.append(separator)
+                length += len(separator)
 
+            word = self.get_random_word(4, 8, rng.randbelow)
             if transform_words:
-                transformations = [
-                    lambda w: w.capitalize(),
-                    lambda w: w.upper(),
-                    lambda w: w.lower(),
-                    lambda w: w.capitalize() if len(w) > 4 else w.upper()
-                ]
-                word = secrets.choice(transformations)(word)
-
-                if secrets.randbelow(3) == 0:
-                    replacements = {'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7'}
-                    for letter, digit in replacements.items():
-                        if letter in word.lower() and secrets.randbelow(2) == 0:
-                            word = word.replace(letter, digit).replace(letter.upper(), digit)
+                word = rng.choice(COMPLEX_WORD_TRANSFORMS)(word)
+                if rng.randbelow(3) == 0:
+                    lowered = word.lower()
+                    for letter, table in LEET_TABLES:
+                        if letter in lowered and rng.randbelow(2) == 0:
+                            word = word.translate(table)
                             break
-
-            words.append(word)
-
-        separators = ['', '-', '_', '.', '!', '@', '#']
-        password = ""
-
-        for i, word in enumerate(words):
-            password += word
-            if i < len(words) - 1:
-                if add_special_chars and secrets.randbelow(2) == 0:
-                    password += secrets.choice(separators[3:])
-                else:
-                    password += secrets.choice(separators[:3])
+            parts.append(word)
+            length += len(word)
 
         if add_numbers:
-            number_positions = ['start', 'middle', 'end']
-            position = secrets.choice(number_positions)
-            number = str(secrets.randbelow(9999)).zfill(2)
-
-            if position == 'start':
-                password = number + password
-            elif position == 'end':
-                password = password + number
+            number = str(rng.randbelow(9999)).zfill(2)
+            position = rng.randbelow(3)
+            if position == 0:
+                parts.insert(0, number)
+            elif position == 2:
+                parts.append(number)
             else:
-                mid = len(password) // 2
-                password = password[:mid] + number + password[mid:]
+                mid = length // 2
+                for index, part in enumerate(parts):
+                    if mid <= len(part):
+                        parts[index] = part[:mid] + number + part[mid:]
+                        break
+                    mid -= len(part)
+                else:
+                    parts.append(number)
+            length += len(number)
 
-        while len(password) < min_length and add_special_chars:
-            special_char = secrets.choice("!@#$%^&*")
-            position = secrets.randbelow(len(password) + 1)
-            password = password[:position] + special_char + password[position:]
+        padding = min_length - length if add_special_chars else 0
+        if padding <= 0:
+            return ''.join(parts)
 
-        return password
+        slots = [None] * (length + padding)
+        for position in rng.sample_positions(length + padding, padding):
+            slots[position] = rng.choice(PADDING_CHARS)
+        chars = iter(''.join(parts))
+        return ''.join([slot or next(chars) for slot in slots])
 
-    def generate_password_by_complexity(self, complexity=5):
+    def get_complexity_options(self, complexity=5):
         if not 1 <= complexity <= 10:
             raise ValueError("Complexity must be 1-10")
 
@@ -251,18 +1035,21 @@ class PasswordGenerator:
             min_digits = 3
             min_special = 3
 
-        return self.generate_password(
-            length=length,
-            use_uppercase=use_uppercase,
-            use_lowercase=use_lowercase,
-            use_digits=use_digits,
-            use_special=use_special,
-            exclude_ambiguous=exclude_ambiguous,
-            min_uppercase=min_uppercase,
-            min_lowercase=min_lowercase,
-            min_digits=min_digits,
-            min_special=min_special
-        )
+        return {
+            "length": length,
+            "use_uppercase": use_uppercase,
+            "use_lowercase": use_lowercase,
+            "use_digits": use_digits,
+            "use_special": use_special,
+            "exclude_ambiguous": exclude_ambiguous,
+            "min_uppercase": min_uppercase,
+            "min_lowercase": min_lowercase,
+            "min_digits": min_digits,
+            "min_special": min_special
+        }
+
+    def generate_password_by_complexity(self, complexity=5):
+        return self.generate_password(**self.get_complexity_options(complexity))
 
     def get_complexity_description(self, complexity):
         descriptions = {
@@ -279,80 +1066,18 @@ class PasswordGenerator:
         }
         return descriptions.get(complexity, "Unknown level")
 
+    def compile_template(self, template):
+        from template import PasswordTemplate, parse_template
+        if isinstance(template, str):
+            template = parse_template(template)
+        return PasswordTemplate(self, template)
+
     def build_custom_password(self, components):
-        password_parts = []
-
-        for component in components:
-            comp_type = component.get('type', 'text')
-
-            if comp_type == 'text':
-                password_parts.append(component.get('value', ''))
-
-            elif comp_type == 'word':
-                word_config = component.get('config', {})
-                word = self.get_random_word(
-                    word_config.get('min_length', 3),
-                    word_config.get('max_length', 10)
-                )
-
-                if word_config.get('capitalize', False):
-                    word = word.capitalize()
-                elif word_config.get('uppercase', False):
-                    word = word.upper()
-                elif word_config.get('lowercase', False):
-                    word = word.lower()
-                elif word_config.get('random_case', False):
-                    word = ''.join(
-                        char.upper() if secrets.randbelow(2) == 0 else char.lower()
-                        for char in word
-                    )
-
-                replacements = word_config.get('replacements', {})
-                for old, new in replacements.items():
-                    word = word.replace(old, new)
-
-                password_parts.append(word)
-
-            elif comp_type == 'random_chars':
-                char_config = component.get('config', {})
-                length = char_config.get('length', 4)
-                char_types = char_config.get('types', ['lowercase', 'uppercase', 'digits'])
-
-                char_pool = ""
-                if 'lowercase' in char_types:
-                    char_pool += self.lowercase
-                if 'uppercase' in char_types:
-                    char_pool += self.uppercase
-                if 'digits' in char_types:
-                    char_pool += self.digits
-                if 'special' in char_types:
-                    char_pool += self.special_chars
-
-                if char_pool:
-                    random_chars = ''.join(secrets.choice(char_pool) for _ in range(length))
-                    password_parts.append(random_chars)
-
-            elif comp_type == 'number':
-                num_config = component.get('config', {})
-                min_val = num_config.get('min', 0)
-                max_val = num_config.get('max', 9999)
-                padding = num_config.get('padding', 0)
-
-                number = str(secrets.randbelow(max_val - min_val + 1) + min_val)
-                if padding > 0:
-                    number = number.zfill(padding)
-
-                password_parts.append(number)
-
-            elif comp_type == 'separator':
-                separators = component.get('options', ['-', '_', '.', '!', '@', '#'])
-                password_parts.append(secrets.choice(separators))
-
-        return ''.join(password_parts)
+        return self.compile_template(components).generate()
 
     def check_password_strength(self, password):
         score = 0
-        feedback = []
+        feedback = 0
 
         if len(password) >= 16:
             score += 3
@@ -361,18 +1086,17 @@ class PasswordGenerator:
         elif len(password) >= 8:
             score += 1
         else:
-            feedback.append("Too short")
+            feedback |= FEEDBACK_TOO_SHORT
 
-        has_lower = any(c.islower() for c in password)
-        has_upper = any(c.isupper() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in self.special_chars for c in password)
+        scan = self.get_pattern_scanner().scan(password)
+        flags = ((scan.has_lower and FLAG_LOWERCASE) | (scan.has_upper and FLAG_UPPERCASE)
+                 | (scan.has_digit and FLAG_DIGITS) | (scan.has_special and FLAG_SPECIAL))
 
-        char_types = sum([has_lower, has_upper, has_digit, has_special])
+        char_types = scan.has_lower + scan.has_upper + scan.has_digit + scan.has_special
         score += char_types
 
         if char_types < 3:
-            feedback.append("Use different character types")
+            feedback |= FEEDBACK_CHAR_TYPES
 
         unique_chars = len(set(password))
         if unique_chars >= len(password) * 0.8:
@@ -380,54 +1104,28 @@ class PasswordGenerator:
         elif unique_chars >= len(password) * 0.6:
             score += 1
         else:
-            feedback.append("Too many repeated characters")
-
-        patterns = [
-            r'(.)\1{2,}',
-            r'(012|123|234|345|456|567|678|789|890)',
-            r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)',
-            r'(qwe|wer|ert|rty|tyu|yui|uio|iop|asd|sdf|dfg|fgh|ghj|hjk|jkl|zxc|xcv|cvb|vbn|bnm)'
-        ]
+            feedback |= FEEDBACK_REPEATED
 
-        pattern_found = False
-        for pattern in patterns:
-            if re.search(pattern, password.lower()):
-                pattern_found = True
-                break
-
-        if pattern_found:
+        if scan.has_repeat or scan.has_sequence:
             score -= 2
-            feedback.append("Avoid simple sequences")
+            feedback |= FEEDBACK_SEQUENCES
 
-        common_passwords = ["password", "123456", "qwerty", "admin", "login", "welcome"]
-        if any(common in password.lower() for common in common_passwords):
+        if scan.has_common:
             score -= 3
-            feedback.append("Avoid common passwords")
-
-        if score >= 10:
-            strength = "Excellent"
-        elif score >= 8:
-            strength = "Very Strong"
-        elif score >= 6:
-            strength = "Strong"
-        elif score >= 4:
-            strength = "Medium"
-        elif score >= 2:
-            strength = "Weak"
-        else:
-            strength = "Very Weak"
+            feedback |= FEEDBACK_COMMON
 
-        return {
-            "score": max(0, score),
-            "strength": strength,
-            "feedback": feedback,
-            "length": len(password),
-            "has_lowercase": has_lower,
-            "has_uppercase": has_upper,
-            "has_digits": has_digit,
-            "has_special": has_special,
-            "unique_chars": unique_chars
-        }
+        if self.breach_filter is not None and password in self.breach_filter:
+            score -= 3
+            feedback |= FEEDBACK_BREACHED
+
+        return StrengthResult(max(0, score), strength_level(score), len(password), flags,
+                              unique_chars, feedback)
+
+    def check_passwords(self, passwords):
+        batch = StrengthBatch()
+        for password in passwords:
+            batch.append(self.check_password_strength(password))
+        return batch
 
 
 def ask_yes_no(prompt, default=True):
@@ -538,6 +1236,13 @@ def create_standard_password(gen):
         analysis = gen.check_password_strength(password)
         print(f"Password strength: {analysis['strength']} (score: {analysis['score']})")
 
+        entropy = gen.password_entropy("standard", length=length, use_uppercase=use_uppercase,
+                                       use_lowercase=use_lowercase, use_digits=use_digits,
+                                       use_special=use_special, exclude_ambiguous=exclude_ambiguous,
+                                       min_uppercase=min_uppercase, min_lowercase=min_lowercase,
+                                       min_digits=min_digits, min_special=min_special)
+        print(f"Generator entropy: {entropy.bits:.1f} bits")
+
         if ask_yes_no("\nSave password to file?", False):
             save_password_to_file(password)
 
@@ -631,7 +1336,8 @@ def create_password_by_complexity(gen):
     print()
 
     for i in range(1, 11):
-        print(f"{i:2d}. {gen.get_complexity_description(i)}")
+        bits = gen.password_entropy("complexity", complexity=i).bits
+        print(f"{i:2d}. {gen.get_complexity_description(i)} ~{bits:.0f} bits")
 
     print()
     complexity = ask_number("Choose complexity level", min_val=1, max_val=10, default=5)
@@ -872,6 +1578,11 @@ def check_password_strength(gen):
     print(f"Score: {analysis['score']}/15")
     print(f"Unique characters: {analysis['unique_chars']}")
 
+    estimate = gen.estimate_entropy(password)
+    print(f"Estimated entropy: {estimate.bits:.1f} bits")
+    for segment in estimate.segments:
+        print(f"   • {segment.token!r}: {segment.pattern} ({segment.bits:.1f} bits)")
+
     print("\nPassword composition:")
     print(f"   • Lowercase letters: {'✓' if analysis['has_lowercase'] else '✗'}")
     print(f"   • Uppercase letters: {'✓' if analysis['has_uppercase'] else '✗'}")
@@ -921,35 +1632,307 @@ def quick_generate(gen):
 
 
 def save_password_to_file(password):
+    save_passwords_to_file([password], "password.txt", "plain")
+
+
+def save_passwords_to_file(passwords, default_path="passwords.txt", default_format="numbered"):
+    from sink import PasswordSink, infer_format
+
+    path = ask_string("File name", default_path)
+    append = os.path.exists(path) and ask_yes_no(f"'{path}' exists. Append instead of overwriting?", True)
     try:
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        with open("password.txt", "w", encoding="utf-8") as f:
-            f.write(f"Generated password ({timestamp}):\n")
-            f.write(f"{password}\n")
-        print("Password saved to 'password.txt'")
-    except Exception as e:
+        with PasswordSink(path, infer_format(path, default_format), append=append) as sink:
+            written = sink.write_all(passwords)
+        print(f"{written} password{'s' if written != 1 else ''} saved to '{path}'")
+    except (OSError, ValueError) as e:
         print(f"Error saving: {e}")
 
 
-def save_passwords_to_file(passwords):
+GENERATOR_METHODS = {
+    "standard": "generate_password",
+    "memorable": "generate_memorable_password",
+    "complex": "generate_complex_memorable_password",
+    "complexity": "generate_password_by_complexity",
+    "custom": "build_custom_password"
+}
+
+
+def generation_job_from_args(args):
+    if args.type == "standard":
+        return "standard", {
+            "length": args.length,
+            "use_uppercase": not args.no_uppercase,
+            "use_lowercase": not args.no_lowercase,
+            "use_digits": not args.no_digits,
+            "use_special": not args.no_special,
+            "exclude_ambiguous": args.exclude_ambiguous,
+            "min_uppercase": 0 if args.no_uppercase else args.min_uppercase,
+            "min_lowercase": 0 if args.no_lowercase else args.min_lowercase,
+            "min_digits": 0 if args.no_digits else args.min_digits,
+            "min_special": 0 if args.no_special else args.min_special
+        }
+
+    if args.type == "memorable":
+        return "memorable", {
+            "num_words": args.words or 4,
+            "separator": args.separator,
+            "add_numbers": not args.no_numbers,
+            "capitalize": not args.no_capitalize,
+            "word_min_length": args.word_min_length,
+            "word_max_length": args.word_max_length
+        }
+
+    if args.type == "complex":
+        return "complex", {
+            "num_words": args.words or 3,
+            "add_special_chars": not args.no_special,
+            "add_numbers": not args.no_numbers,
+            "transform_words": not args.no_transform,
+            "min_length": args.min_length
+        }
+
+    if args.type == "complexity":
+        return "complexity", {"complexity": args.complexity}
+
+    if args.template:
+        return "custom", {"components": args.template}
+    if not args.components:
+        raise ValueError("Custom passwords need --components or --template")
+    components = args.components
+    if components.startswith("@"):
+        with open(components[1:], encoding="utf-8") as f:
+            components = f.read()
+    return "custom", {"components": json.loads(components)}
+
+
+def iter_password_job(gen, kind, count, options):
+    if kind == "standard":
+        return gen.generate_passwords(count, as_iterator=True, **options)
+    if kind == "complex":
+        return gen.generate_complex_memorable_passwords(count, as_iterator=True, **options)
+    if kind == "custom":
+        return gen.compile_template(options["components"]).generate_many(count, as_iterator=True)
+    method = getattr(gen, GENERATOR_METHODS[kind])
+    return (method(**options) for _ in range(count))
+
+
+def build_arg_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Password Generator")
+    parser.add_argument("--breach-filter", help="Compiled breach filter used by strength checks")
+    subparsers = parser.add_subparsers(dest="command")
+
+    generate = subparsers.add_parser("generate", help="Generate passwords without the menu")
+    generate.add_argument("--type", default="standard",
+                          choices=["standard", "memorable", "complex", "complexity", "custom"])
+    generate.add_argument("--count", type=int, default=1)
+    generate.add_argument("--format", dest="output_format", default="plain",
+                          choices=["plain", "numbered", "jsonl", "csv"])
+    generate.add_argument("--output", "-o", help="Output file (default: stdout)")
+    generate.add_argument("--compress", default="auto", choices=["auto", "none", "gzip", "xz"],
+                          help="Compress the output (default: from the .gz/.xz extension)")
+    generate.add_argument("--append", action="store_true", help="Append to the output file")
+    generate.add_argument("--no-atomic", action="store_true",
+                          help="Write the output file in place instead of renaming it when done")
+    generate.add_argument("--fsync", action="store_true", help="Flush the output file to disk when done")
+    generate.add_argument("--buffer-size", type=int, default=1 << 20)
+    generate.add_argument("--workers", type=int, default=1, help="Worker processes for generation")
+    generate.add_argument("--chunk-size", type=int, default=10000)
+    generate.add_argument("--unordered", action="store_true", help="Emit chunks as workers finish")
+    generate.add_argument("--rng", default="system", choices=RANDOM_BACKENDS,
+                          help="Random backend (seeded needs --seed and gives reproducible output)")
+    generate.add_argument("--seed", help="Seed for the seeded backend")
+    generate.add_argument("--unique", nargs="?", const="warn", choices=["warn", "strict"],
+                          help="Never repeat a password; 'strict' fails instead of warning near the birthday bound")
+
+    generate.add_argument("--length", type=int, default=12)
+    generate.add_argument("--no-uppercase", action="store_true")
+    generate.add_argument("--no-lowercase", action="store_true")
+    generate.add_argument("--no-digits", action="store_true")
+    generate.add_argument("--no-special", action="store_true")
+    generate.add_argument("--exclude-ambiguous", action="store_true")
+    generate.add_argument("--min-uppercase", type=int, default=1)
+    generate.add_argument("--min-lowercase", type=int, default=1)
+    generate.add_argument("--min-digits", type=int, default=1)
+    generate.add_argument("--min-special", type=int, default=1)
+
+    generate.add_argument("--words", type=int)
+    generate.add_argument("--separator", default="-")
+    generate.add_argument("--no-numbers", action="store_true")
+    generate.add_argument("--no-capitalize", action="store_true")
+    generate.add_argument("--no-transform", action="store_true")
+    generate.add_argument("--word-min-length", type=int, default=3)
+    generate.add_argument("--word-max-length", type=int, default=8)
+    generate.add_argument("--min-length", type=int, default=16)
+
+    generate.add_argument("--complexity", type=int, default=5)
+    generate.add_argument("--components", help="Component list as JSON, or @file")
+    generate.add_argument("--template", help="Template string, e.g. '{word:4-8:cap}{sep:-_.}{num:0-999:3}'")
+    generate.add_argument("--wordlist", help="Compiled wordlist file for word-based passwords")
+
+    build = subparsers.add_parser("build-wordlist", help="Compile a text wordlist for --wordlist")
+    build.add_argument("source", help="Text file with one word per line (EFF dice lists work too)")
+    build.add_argument("output")
+    build.add_argument("--min-length", type=int, default=3)
+    build.add_argument("--max-length", type=int, default=12)
+
+    audit = subparsers.add_parser("audit", help="Score every password in a file")
+    audit.add_argument("input", help="Newline-delimited password file")
+    audit.add_argument("--format", dest="output_format", default="jsonl", choices=["jsonl", "csv"])
+    audit.add_argument("--output", "-o", help="Output file (default: stdout)")
+    audit.add_argument("--summary", help="Write aggregate histograms as JSON to this file")
+    audit.add_argument("--workers", type=int, default=1)
+    audit.add_argument("--chunk-bytes", type=int, default=4 << 20)
+    audit.add_argument("--buffer-size", type=int, default=1 << 20)
+
+    breach = subparsers.add_parser("build-breach-filter",
+                                   help="Compile a leaked-password corpus into a Bloom filter")
+    breach.add_argument("corpus", help="Newline-delimited password corpus")
+    breach.add_argument("output")
+    breach.add_argument("--fp-rate", type=float, default=0.001, help="Target false positive rate")
+    breach.add_argument("--expected-items", type=int,
+                        help="Corpus size, if known (skips the counting pass)")
+
+    serve = subparsers.add_parser("serve", help="Run the local HTTP generation service")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--unix", help="Listen on this Unix socket path instead of TCP")
+    serve.add_argument("--workers", type=int, help="Worker processes for bulk jobs (default: CPU count)")
+    serve.add_argument("--chunk-size", type=int, default=10000)
+    serve.add_argument("--wordlist", help="Compiled wordlist file for word-based passwords")
+
+    return parser
+
+
+def run_generate(args):
+    if args.count < 0:
+        raise ValueError("Count cannot be negative")
+
+    kind, options = generation_job_from_args(args)
+    if args.workers > 1:
+        from parallel import ParallelGenerator
+        engine = ParallelGenerator(workers=args.workers, chunk_size=args.chunk_size,
+                                   wordlist=args.wordlist, random_backend=args.rng)
+        draw = lambda size: engine.iter_passwords(size, kind, ordered=not args.unordered, **options)
+        gen = PasswordGenerator(args.wordlist) if args.unique else None
+    else:
+        gen = PasswordGenerator(args.wordlist, random_backend=args.rng, seed=args.seed)
+        draw = lambda size: iter_password_job(gen, kind, size, options)
+
+    if args.unique:
+        from unique import unique_passwords
+        passwords = unique_passwords(gen, kind, args.count, options, draw, strict=args.unique == "strict")
+    elif kind == "standard" and args.output_format == "plain" and args.workers == 1:
+        passwords = None
+    else:
+        passwords = draw(args.count)
+    start = time.perf_counter()
+
+    from sink import PasswordSink
+    with PasswordSink(args.output, args.output_format, None if args.compress == "none" else args.compress,
+                      append=args.append, atomic=False if args.no_atomic else None, fsync=args.fsync,
+                      buffer_size=args.buffer_size) as sink:
+        if passwords is None:
+            stride = options["length"] + 1
+            for chunk in gen.iter_password_bytes(args.count, **options):
+                sink.write_bytes(chunk, len(chunk) // stride)
+            written = sink.written
+        else:
+            written = sink.write_all(passwords)
+
+    elapsed = time.perf_counter() - start
+    rate = written / elapsed if elapsed > 0 else float("inf")
+    print(f"Generated {written} passwords in {elapsed:.2f}s ({rate:,.0f} passwords/s)", file=sys.stderr)
+    if gen is not None and gen.word_cache is not None:
+        stats = gen.word_cache.stats()
+        print(f"Word cache: {stats['hits']} hits, {stats['misses']} misses, {stats['refreshes']} refreshes, "
+              f"{stats['evictions']} evictions, {stats['words']} words cached", file=sys.stderr)
+
+
+def run_build_wordlist(args):
+    from wordlist import build_wordlist
+    count = build_wordlist(args.source, args.output, args.min_length, args.max_length)
+    print(f"Compiled {count} words into '{args.output}'", file=sys.stderr)
+
+
+def run_build_breach_filter(args):
+    from breach import build_bloom_filter
+    start = time.perf_counter()
+    count = build_bloom_filter(args.corpus, args.output, args.fp_rate, args.expected_items)
+    elapsed = time.perf_counter() - start
+    print(f"Added {count} passwords to '{args.output}' in {elapsed:.2f}s", file=sys.stderr)
+
+
+def run_audit(args):
+    from audit import PasswordAuditor, summarize
+
+    auditor = PasswordAuditor(workers=args.workers, chunk_bytes=args.chunk_bytes,
+                              breach_filter=args.breach_filter)
+    start = time.perf_counter()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", buffering=args.buffer_size) as out:
+            stats = auditor.audit(args.input, out, args.output_format)
+    else:
+        stats = auditor.audit(args.input, sys.stdout, args.output_format)
+
+    elapsed = time.perf_counter() - start
+    summary = summarize(stats)
+
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    rate = summary["passwords"] / elapsed if elapsed > 0 else float("inf")
+    print(f"Audited {summary['passwords']} passwords in {elapsed:.2f}s ({rate:,.0f} passwords/s)",
+          file=sys.stderr)
+    for strength, count in summary["strength"].items():
+        print(f"   {strength:>12}: {count}", file=sys.stderr)
+
+
+def run_serve(args):
+    import asyncio
+    from server import serve
+
+    where = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Serving password generation on {where}", file=sys.stderr)
     try:
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        with open("passwords.txt", "w", encoding="utf-8") as f:
-            f.write(f"Generated passwords ({timestamp}):\n")
-            f.write("=" * 40 + "\n")
-            for i, password in enumerate(passwords, 1):
-                f.write(f"{i}. {password}\n")
-        print(f"{len(passwords)} passwords saved to 'passwords.txt'")
-    except Exception as e:
-        print(f"Error saving: {e}")
+        asyncio.run(serve(args.host, args.port, args.unix, workers=args.workers,
+                          chunk_size=args.chunk_size, wordlist=args.wordlist,
+                          breach_filter=args.breach_filter))
+    except KeyboardInterrupt:
+        pass
+
+
+def run_cli(argv):
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command is None:
+            main(PasswordGenerator(breach_filter=args.breach_filter))
+        elif args.command == "build-wordlist":
+            run_build_wordlist(args)
+        elif args.command == "build-breach-filter":
+            run_build_breach_filter(args)
+        elif args.command == "audit":
+            run_audit(args)
+        elif args.command == "serve":
+            run_serve(args)
+        else:
+            run_generate(args)
+    except BrokenPipeError:
+        return 0
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
 
 
-def main():
-    gen = PasswordGenerator()
+def main(gen=None):
+    if gen is None:
+        gen = PasswordGenerator()
 
     print("Welcome to Password Generator!")
     print("Checking word libraries availability...")
@@ -993,4 +1976,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
@@ -0,0 +1,195 @@
+import math
+import random
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from types import GeneratorType
+
+SUB_BUCKETS = 8
+
+
+class LatencyHistogram:
+    __slots__ = ("buckets", "calls", "total_ns", "entropy_bytes")
+
+    def __init__(self):
+        self.buckets = Counter()
+        self.calls = 0
+        self.total_ns = 0
+        self.entropy_bytes = 0
+
+    def record(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.buckets[int(math.log2(elapsed_ns) * SUB_BUCKETS) if elapsed_ns > 0 else 0] += 1
+
+    def percentile(self, q):
+        if not self.calls:
+            return 0.0
+        target = q * self.calls
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return 2 ** ((bucket + 0.5) / SUB_BUCKETS) / 1e9
+        return 2 ** ((max(self.buckets) + 0.5) / SUB_BUCKETS) / 1e9
+
+
+class EntropyMeter:
+    __slots__ = ("buffers", "direct")
+
+    def __init__(self):
+        self.buffers = []
+        self.direct = 0
+
+    @property
+    def consumed(self):
+        return self.direct + sum(buffer.consumed for buffer in self.buffers)
+
+
+class CountingRandomSource(random.Random):
+    def __init__(self, metrics, source):
+        self.metrics = metrics
+        self.source = source
+        super().__init__()
+
+    def seed(self, a=None, version=2):
+        pass
+
+    def random(self):
+        self.metrics.consume(7)
+        return self.source.random()
+
+    def getrandbits(self, k):
+        self.metrics.consume((k + 7) // 8)
+        return self.source.getrandbits(k)
+
+    def randbytes(self, n):
+        self.metrics.counters["entropy_bytes_fetched"] += n
+        return self.source.randbytes(n)
+
+    def randbelow(self, n):
+        randbelow = getattr(self.source, "randbelow", None)
+        if randbelow is None:
+            return self._randbelow(n)
+        self.metrics.consume(((n - 1).bit_length() + 7) // 8)
+        return randbelow(n)
+
+
+class Metrics:
+    QUANTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self):
+        self.methods = {}
+        self.counters = Counter()
+        self.started = time.time()
+        self._local = threading.local()
+
+    def _meters(self):
+        meters = getattr(self._local, "meters", None)
+        if meters is None:
+            meters = self._local.meters = []
+        return meters
+
+    def track(self, buffer):
+        for meter in self._meters():
+            meter.buffers.append(buffer)
+        return buffer
+
+    def consume(self, n):
+        self.counters["entropy_bytes_fetched"] += n
+        for meter in self._meters():
+            meter.direct += n
+
+    def wrap(self, name, function):
+        histogram = self.methods.setdefault(name, LatencyHistogram())
+        perf_counter_ns = time.perf_counter_ns
+        meters = self._meters
+
+        @wraps(function)
+        def instrumented(*args, **kwargs):
+            meter = EntropyMeter()
+            active = meters()
+            active.append(meter)
+            start = perf_counter_ns()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                histogram.entropy_bytes += meter.consumed
+                raise
+            finally:
+                histogram.record(perf_counter_ns() - start)
+                active.pop()
+
+            if isinstance(result, GeneratorType):
+                return self._metered(result, histogram, meter)
+            histogram.entropy_bytes += meter.consumed
+            return result
+
+        return instrumented
+
+    def _metered(self, iterator, histogram, meter):
+        try:
+            while True:
+                active = self._meters()
+                active.append(meter)
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    active.pop()
+                yield item
+        finally:
+            iterator.close()
+            histogram.entropy_bytes += meter.consumed
+
+    def increment(self, name, amount=1):
+        self.counters[name] += amount
+
+    def reset(self):
+        for histogram in self.methods.values():
+            histogram.__init__()
+        self.counters.clear()
+        self.started = time.time()
+
+    def snapshot(self):
+        return {
+            "uptime_seconds": time.time() - self.started,
+            "methods": {
+                name: {
+                    "calls": histogram.calls,
+                    "total_seconds": histogram.total_ns / 1e9,
+                    "entropy_bytes": histogram.entropy_bytes,
+                    **{f"p{int(q * 100)}_seconds": histogram.percentile(q) for q in self.QUANTILES}
+                }
+                for name, histogram in self.methods.items()
+            },
+            "counters": dict(self.counters)
+        }
+
+    def render_text(self, prefix="password_generator"):
+        snapshot = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_calls_total counter",
+            *(f'{prefix}_calls_total{{method="{name}"}} {data["calls"]}'
+              for name, data in snapshot["methods"].items()),
+            f"# TYPE {prefix}_latency_seconds summary"
+        ]
+
+        for name, data in snapshot["methods"].items():
+            for q in self.QUANTILES:
+                value = data[f"p{int(q * 100)}_seconds"]
+                lines.append(f'{prefix}_latency_seconds{{method="{name}",quantile="{q}"}} {value:.9f}')
+            lines.append(f'{prefix}_latency_seconds_sum{{method="{name}"}} {data["total_seconds"]:.9f}')
+            lines.append(f'{prefix}_latency_seconds_count{{method="{name}"}} {data["calls"]}')
+
+        lines.append(f"# TYPE {prefix}_entropy_bytes_total counter")
+        for name, data in snapshot["methods"].items():
+            lines.append(f'{prefix}_entropy_bytes_total{{method="{name}"}} {data["entropy_bytes"]}')
+
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,90 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from main import GENERATOR_METHODS, PasswordGenerator, iter_password_job
+
+_worker_generator = None
+
+
+def _init_worker(wordlist=None, breach_filter=None, random_backend="system"):
+    global _worker_generator
+    _worker_generator = PasswordGenerator(wordlist, breach_filter, random_backend)
+
+
+def _generate_chunk(kind, size, options):
+    return list(iter_password_job(_worker_generator, kind, size, options))
+
+
+def _generate_one(kind, options):
+    return getattr(_worker_generator, GENERATOR_METHODS[kind])(**options)
+
+
+def _entropy(kind, options):
+    return _worker_generator.password_entropy(kind, **options)._asdict()
+
+
+def _check_chunk(passwords):
+    return [result.to_dict() for result in _worker_generator.check_passwords(passwords)]
+
+
+def iter_bounded_results(pool, tasks, max_pending, ordered=True):
+    pending = deque()
+    for function, *args in tasks:
+        pending.append(pool.submit(function, *args))
+        if len(pending) >= max_pending:
+            yield from _drain(pending, ordered)
+
+    while pending:
+        yield from _drain(pending, ordered)
+
+
+def _drain(pending, ordered):
+    if ordered:
+        yield pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
+
+
+class ParallelGenerator:
+    def __init__(self, workers=None, chunk_size=10000, max_pending=None, wordlist=None,
+                 random_backend="system"):
+        self.workers = workers or os.cpu_count() or 1
+        self.wordlist = wordlist
+        self.random_backend = random_backend
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or self.workers * 2
+
+        if self.workers < 1:
+            raise ValueError("Need at least one worker")
+        if self.chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        if random_backend == "seeded":
+            raise ValueError("Seeded generation is only reproducible with a single worker")
+
+    def iter_chunks(self, count, kind="standard", ordered=True, **options):
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        tasks = ((_generate_chunk, kind, size, options) for size in self._chunk_sizes(count))
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.wordlist, None, self.random_backend)) as pool:
+            yield from iter_bounded_results(pool, tasks, self.max_pending, ordered)
+
+    def iter_passwords(self, count, kind="standard", ordered=True, **options):
+        for chunk in self.iter_chunks(count, kind, ordered, **options):
+            yield from chunk
+
+    def generate(self, count, kind="standard", ordered=True, **options):
+        return list(self.iter_passwords(count, kind, ordered, **options))
+
+    def _chunk_sizes(self, count):
+        full, rest = divmod(count, self.chunk_size)
+        for _ in range(full):
+            yield self.chunk_size
+        if rest:
+            yield rest
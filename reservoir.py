@@ -0,0 +1,176 @@
+import threading
+from collections import deque
+
+from main import PasswordGenerator, iter_password_job
+
+REFILL_SLICE = 16
+
+
+def generate_one(generator, kind, options):
+    if kind == "standard":
+        return generator.generate_password(**options)
+    return next(iter_password_job(generator, kind, 1, options))
+
+
+class ReservoirPolicy:
+    __slots__ = ("name", "kind", "options", "items", "hits", "misses", "generated", "refills")
+
+    def __init__(self, name, kind, options):
+        self.name = name
+        self.kind = kind
+        self.options = options
+        self.items = deque()
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        self.refills = 0
+
+
+class PasswordReservoir:
+    def __init__(self, generator=None, capacity=1000, low_water=None, refill_batch=None,
+                 background=True):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+
+        self.generator = generator or PasswordGenerator()
+        self.capacity = capacity
+        self.low_water = capacity // 4 if low_water is None else low_water
+        if not 0 <= self.low_water < capacity:
+            raise ValueError("Low water mark must be at least 0 and below the capacity")
+        self.refill_batch = refill_batch or capacity
+        self.background = background
+        self.policies = {}
+
+        self._condition = threading.Condition()
+        self._generating = threading.Lock()
+        self._thread = None
+        self._stopped = False
+
+    def register(self, name, kind="standard", prefill=True, **options):
+        with self._condition:
+            if name in self.policies:
+                raise ValueError(f"Policy '{name}' already registered")
+            self.policies[name] = ReservoirPolicy(name, kind, options)
+
+        if prefill:
+            self._refill(self.policies[name])
+        return self
+
+    def register_complexity(self, level, prefill=True):
+        if not 1 <= level <= 10:
+            raise ValueError("Complexity must be 1-10")
+        return self.register(f"complexity:{level}", "complexity", prefill, complexity=level)
+
+    def take(self, name):
+        with self._condition:
+            policy = self.policies[name]
+            if policy.items:
+                policy.hits += 1
+                password = self._pop(policy)
+            else:
+                policy.misses += 1
+                password = None
+            low = len(policy.items) <= self.low_water
+            if low:
+                self._condition.notify()
+
+        if password is None:
+            with self._generating:
+                password = generate_one(self.generator, policy.kind, policy.options)
+        if low and not self.background:
+            self._refill(policy)
+        return password
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="password-reservoir", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, wipe=True):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if wipe:
+            self.clear()
+
+    def clear(self):
+        with self._condition:
+            for policy in self.policies.values():
+                while policy.items:
+                    self._pop(policy)
+
+    def __enter__(self):
+        if self.background:
+            self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self):
+        with self._condition:
+            return {
+                name: {
+                    "size": len(policy.items),
+                    "hits": policy.hits,
+                    "misses": policy.misses,
+                    "hit_rate": policy.hits / max(1, policy.hits + policy.misses),
+                    "generated": policy.generated,
+                    "refills": policy.refills
+                }
+                for name, policy in self.policies.items()
+            }
+
+    @staticmethod
+    def _pop(policy):
+        buffer = policy.items.popleft()
+        password = buffer.decode("utf-8")
+        buffer[:] = bytes(len(buffer))
+        return password
+
+    def _needs_refill(self):
+        return any(len(policy.items) <= self.low_water for policy in self.policies.values())
+
+    def _refill(self, policy):
+        with self._condition:
+            missing = min(self.capacity - len(policy.items), self.refill_batch)
+        if missing <= 0:
+            return
+
+        while missing > 0:
+            size = min(missing, REFILL_SLICE)
+            with self._generating:
+                passwords = [bytearray(password.encode("utf-8"))
+                             for password in iter_password_job(self.generator, policy.kind, size, policy.options)]
+            missing -= size
+
+            with self._condition:
+                room = self.capacity - len(policy.items)
+                policy.items.extend(passwords[:room])
+                for surplus in passwords[room:]:
+                    surplus[:] = bytes(len(surplus))
+                policy.generated += len(passwords)
+            if self._stopped:
+                break
+
+        with self._condition:
+            policy.refills += 1
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and not self._needs_refill():
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                pending = [policy for policy in self.policies.values()
+                           if len(policy.items) <= self.low_water]
+
+            for policy in pending:
+                while not self._stopped and len(policy.items) < self.capacity:
+                    self._refill(policy)
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import random
+import threading
+import weakref
+
+KEY_SIZE = 32
+
+_reseeding_streams = weakref.WeakSet()
+
+
+def _reseed_after_fork():
+    for stream in list(_reseeding_streams):
+        stream._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+
+def seed_key(seed):
+    if isinstance(seed, (bytes, bytearray)):
+        material = bytes(seed)
+    elif isinstance(seed, (int, str)):
+        material = str(seed).encode("utf-8")
+    else:
+        raise TypeError("Seed must be an int, str or bytes")
+    return hashlib.blake2b(material, digest_size=KEY_SIZE, person=b"pwgen-seed").digest()
+
+
+class StreamRandomSource(random.Random):
+    reseeding = True
+
+    def __init__(self, seed=None, block_size=65536, reseed_interval=1 << 26):
+        self.block_size = block_size
+        self.reseed_interval = reseed_interval
+        self._lock = threading.Lock()
+        super().__init__(seed)
+        if self.reseeding:
+            _reseeding_streams.add(self)
+
+    def seed(self, a=None, version=2):
+        with self._lock:
+            self._key = os.urandom(KEY_SIZE) if a is None else seed_key(a)
+            self._counter = 0
+            self._generated = 0
+            self._block = b""
+            self._pos = 0
+            self.gauss_next = None
+
+    def reseed(self, entropy=None):
+        with self._lock:
+            self._reseed(entropy)
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._reseed()
+
+    def _reseed(self, entropy=None):
+        material = self._key + (entropy if entropy is not None else os.urandom(KEY_SIZE))
+        self._key = hashlib.blake2b(material, digest_size=KEY_SIZE, person=b"pwgen-reseed").digest()
+        self._generated = 0
+        self._block = b""
+        self._pos = 0
+
+    def _refill(self, n):
+        if self.reseeding and self._generated >= self.reseed_interval:
+            self._reseed()
+
+        size = max(self.block_size, n)
+        output = hashlib.shake_128(self._key + self._counter.to_bytes(8, "little")).digest(KEY_SIZE + size)
+        self._key = output[:KEY_SIZE]
+        self._counter += 1
+        self._generated += size
+        self._block = self._block[self._pos:] + output[KEY_SIZE:]
+        self._pos = 0
+
+    def _read(self, n):
+        if self._pos + n > len(self._block):
+            self._refill(n)
+        data = self._block[self._pos:self._pos + n]
+        self._pos += n
+        return data
+
+    def randbytes(self, n):
+        with self._lock:
+            return self._read(n)
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("Number of bits must be non-negative")
+        if k == 0:
+            return 0
+        return int.from_bytes(self.randbytes((k + 7) // 8), "little") >> (-k % 8)
+
+    def random(self):
+        return (int.from_bytes(self.randbytes(7), "little") >> 3) * 2.0 ** -53
+
+    def randbelow(self, n):
+        if n <= 0:
+            raise ValueError("Upper bound must be positive")
+        bits = (n - 1).bit_length()
+        mask = (1 << bits) - 1
+        with self._lock:
+            if bits <= 8:
+                while True:
+                    if self._pos >= len(self._block):
+                        self._refill(1)
+                    value = self._block[self._pos] & mask
+                    self._pos += 1
+                    if value < n:
+                        return value
+            size = (bits + 7) // 8
+            while True:
+                value = int.from_bytes(self._read(size), "little") & mask
+                if value < n:
+                    return value
+
+    _randbelow = randbelow
+
+    def getstate(self):
+        with self._lock:
+            return self._key, self._counter, self._generated, self._block[self._pos:]
+
+    def setstate(self, state):
+        with self._lock:
+            self._key, self._counter, self._generated, self._block = state
+            self._pos = 0
+
+
+class SeededRandomSource(StreamRandomSource):
+    reseeding = False
+
+    def __init__(self, seed, block_size=65536):
+        if seed is None:
+            raise ValueError("The seeded backend needs a seed")
+        super().__init__(seed, block_size, reseed_interval=None)
+
+    def reseed(self, entropy=None):
+        raise ValueError("The seeded backend cannot be reseeded")
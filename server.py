@@ -0,0 +1,302 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+
+from main import GENERATOR_METHODS, PasswordGenerator
+from parallel import _check_chunk, _entropy, _generate_chunk, _generate_one, _init_worker
+
+MAX_BODY_BYTES = 1 << 20
+MAX_BULK_COUNT = 100_000_000
+MAX_LENGTH = 4096
+MAX_WORDS = 256
+MAX_COMPONENTS = 256
+MAX_NUMBER_DIGITS = 64
+LENGTH_OPTIONS = ("length", "min_length", "max_length", "word_min_length", "word_max_length", "padding")
+INLINE_CHECK_LIMIT = 64
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class PasswordService:
+    def __init__(self, workers=None, chunk_size=10000, wordlist=None, breach_filter=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = self.workers * 2
+        self.generator = PasswordGenerator(wordlist, breach_filter)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=worker_context(),
+                                            initializer=_init_worker, initargs=(wordlist, breach_filter))
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, path, query, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                try:
+                    await self.dispatch(method, path, query, body, writer)
+                except HTTPError as e:
+                    await send_json(writer, e.status, {"error": e.message})
+                except (ValueError, TypeError, KeyError, OverflowError) as e:
+                    await send_json(writer, HTTPStatus.BAD_REQUEST, {"error": str(e)})
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        except HTTPError as e:
+            await send_json(writer, e.status, {"error": e.message})
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, query, body, writer):
+        if path == "/health":
+            await send_json(writer, HTTPStatus.OK, {"status": "ok"})
+        elif path == "/generate" and method in ("GET", "POST"):
+            kind, options, _ = self.parse_job(method, query, body)
+            password = await asyncio.get_running_loop().run_in_executor(self.executor, _generate_one, kind, options)
+            await send_json(writer, HTTPStatus.OK, {"password": password})
+        elif path == "/generate/bulk" and method in ("GET", "POST"):
+            kind, options, request = self.parse_job(method, query, body)
+            await self.stream_bulk(writer, kind, options, request)
+        elif path == "/entropy" and method in ("GET", "POST"):
+            kind, options, _ = self.parse_job(method, query, body)
+            entropy = await asyncio.get_running_loop().run_in_executor(self.executor, _entropy, kind, options)
+            await send_json(writer, HTTPStatus.OK, entropy)
+        elif path == "/check" and method == "POST":
+            await self.check(writer, decode_json(body))
+        else:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {method} {path}")
+
+    def parse_job(self, method, query, body):
+        if method == "GET":
+            request = {key: coerce_query_value(value) for key, value in query.items()}
+            kind = request.pop("type", "standard")
+            count = request.pop("count", 1)
+            output_format = request.pop("format", "plain")
+            options = request
+            request = {"count": count, "format": output_format}
+        else:
+            request = decode_json(body)
+            kind = request.get("type", "standard")
+            options = dict(request.get("options", {}))
+            if "components" in request:
+                options["components"] = request["components"]
+
+        if kind not in GENERATOR_METHODS:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Unknown password type '{kind}'")
+        check_limits(options)
+        return kind, options, request
+
+    async def stream_bulk(self, writer, kind, options, request):
+        count = int(request.get("count", 1))
+        output_format = request.get("format", "plain")
+        if not 0 <= count <= MAX_BULK_COUNT:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Count must be 0-{MAX_BULK_COUNT}")
+        if output_format not in ("plain", "jsonl"):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Format must be plain or jsonl")
+
+        loop = asyncio.get_running_loop()
+        sizes = deque(chunk_sizes(count, self.chunk_size))
+        pending = deque()
+
+        def submit():
+            while sizes and len(pending) < self.max_pending:
+                pending.append(loop.run_in_executor(self.executor, _generate_chunk,
+                                                    kind, sizes.popleft(), options))
+
+        head_sent = False
+        try:
+            submit()
+            chunk = await pending.popleft() if pending else []
+            content_type = "application/x-ndjson" if output_format == "jsonl" else "text/plain"
+            writer.write(response_head(HTTPStatus.OK, content_type, chunked=True))
+            head_sent = True
+
+            while True:
+                submit()
+                if output_format == "jsonl":
+                    data = ''.join(json.dumps({"password": password}) + "\n" for password in chunk)
+                else:
+                    data = ''.join(password + "\n" for password in chunk)
+                if data:
+                    encoded = data.encode("utf-8")
+                    writer.write(f"{len(encoded):x}\r\n".encode("ascii") + encoded + b"\r\n")
+                    await writer.drain()
+                if not pending:
+                    break
+                chunk = await pending.popleft()
+
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        except Exception as e:
+            if head_sent:
+                raise ConnectionAbortedError("Bulk response failed after it started streaming") from e
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def check(self, writer, request):
+        if "password" in request:
+            result = self.generator.check_password_strength(str(request["password"]))
+            await send_json(writer, HTTPStatus.OK, result.to_dict())
+            return
+
+        passwords = [str(password) for password in request.get("passwords", [])]
+        if len(passwords) <= INLINE_CHECK_LIMIT:
+            results = [result.to_dict() for result in self.generator.check_passwords(passwords)]
+        else:
+            loop = asyncio.get_running_loop()
+            chunks = [passwords[i:i + self.chunk_size] for i in range(0, len(passwords), self.chunk_size)]
+            parts = await asyncio.gather(*(loop.run_in_executor(self.executor, _check_chunk, chunk)
+                                           for chunk in chunks))
+            results = [result for part in parts for result in part]
+        await send_json(writer, HTTPStatus.OK, {"results": results})
+
+
+def worker_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def check_limit(name, value, limit):
+    if isinstance(value, int) and not isinstance(value, bool) and value > limit:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{name}' must be at most {limit}")
+
+
+def check_limits(options):
+    for name in LENGTH_OPTIONS:
+        check_limit(name, options.get(name), MAX_LENGTH)
+    check_limit("num_words", options.get("num_words"), MAX_WORDS)
+
+    components = options.get("components")
+    if components is None:
+        return
+    if isinstance(components, str):
+        from template import parse_template
+        components = parse_template(components)
+    if not isinstance(components, (list, tuple)):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Components must be a template or a list")
+    check_limit("components", len(components), MAX_COMPONENTS)
+    for component in components:
+        config = component.get("config", {}) if isinstance(component, Mapping) else {}
+        if not isinstance(config, Mapping):
+            continue
+        for name in LENGTH_OPTIONS:
+            check_limit(name, config.get(name), MAX_LENGTH)
+        for name in ("min", "max"):
+            value = config.get(name)
+            if isinstance(value, int):
+                check_limit(name + " digits", len(str(abs(value))), MAX_NUMBER_DIGITS)
+
+
+def chunk_sizes(count, chunk_size):
+    full, rest = divmod(count, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def coerce_query_value(value):
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def decode_json(body):
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be valid JSON")
+    if not isinstance(data, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+    return data
+
+
+async def read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+
+    try:
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+
+    url = urlsplit(target)
+    return method.upper(), url.path, dict(parse_qsl(url.query)), headers, body
+
+
+def response_head(status, content_type, length=None, chunked=False):
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}", f"Content-Type: {content_type}"]
+    if chunked:
+        lines.append("Transfer-Encoding: chunked")
+    else:
+        lines.append(f"Content-Length: {length}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def send_json(writer, status, payload):
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(response_head(status, "application/json", len(body)) + body)
+    await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8080, unix_path=None, **service_options):
+    service = PasswordService(**service_options)
+    try:
+        if unix_path:
+            server = await asyncio.start_unix_server(service.handle_connection, path=unix_path)
+        else:
+            server = await asyncio.start_server(service.handle_connection, host, port)
+
+        loop = asyncio.get_running_loop()
+        stopped = asyncio.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, stopped.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        async with server:
+            await stopped.wait()
+    finally:
+        service.close()
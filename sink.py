@@ -0,0 +1,166 @@
+import gzip
+import json
+import lzma
+import os
+import sys
+import tempfile
+from itertools import islice
+
+OUTPUT_FORMATS = ("plain", "numbered", "csv", "jsonl")
+COMPRESSIONS = ("gzip", "xz")
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".gzip": "gzip", ".xz": "xz"}
+FORMAT_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+def infer_compression(path):
+    if not path:
+        return None
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def infer_format(path, default="plain"):
+    if not path:
+        return default
+    root, extension = os.path.splitext(path)
+    if extension.lower() in COMPRESSION_EXTENSIONS:
+        extension = os.path.splitext(root)[1]
+    return FORMAT_EXTENSIONS.get(extension.lower(), default)
+
+
+def format_password_line(password, index, output_format):
+    if output_format == "jsonl":
+        return json.dumps({"password": password}) + "\n"
+    if output_format == "csv":
+        return f'{index},"{password.replace(chr(34), chr(34) * 2)}"\n'
+    if output_format == "numbered":
+        return f"{index}. {password}\n"
+    return password + "\n"
+
+
+def fsync_directory(path):
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class PasswordSink:
+    def __init__(self, path=None, output_format="plain", compression="auto", append=False,
+                 atomic=None, fsync=False, buffer_size=1 << 20, batch_size=8192):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'")
+        if compression == "auto":
+            compression = infer_compression(path)
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}'")
+        if atomic is None:
+            atomic = path is not None and not append
+        if atomic and append:
+            raise ValueError("Appending to a file cannot be atomic")
+        if atomic and path is None:
+            raise ValueError("Standard output cannot be written atomically")
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        self.path = path
+        self.output_format = output_format
+        self.compression = compression
+        self.append = append
+        self.atomic = atomic
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.written = 0
+        self._temp_path = None
+        self._open(buffer_size)
+
+    def _open(self, buffer_size):
+        if self.path is None:
+            sys.stdout.flush()
+            self._raw = sys.stdout.buffer
+            needs_header = True
+        elif self.atomic:
+            fd, self._temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(self.path)}.", suffix=".tmp",
+                                                   dir=os.path.dirname(os.path.abspath(self.path)))
+            self._raw = os.fdopen(fd, "wb", buffering=buffer_size)
+            needs_header = True
+        else:
+            flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if self.append else os.O_TRUNC)
+            fd = os.open(self.path, flags | getattr(os, "O_BINARY", 0), 0o600)
+            self._raw = os.fdopen(fd, "ab" if self.append else "wb", buffering=buffer_size)
+            needs_header = not self.append or os.fstat(fd).st_size == 0
+
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(filename="", mode="wb", compresslevel=6, fileobj=self._raw)
+        elif self.compression == "xz":
+            self._stream = lzma.LZMAFile(self._raw, "wb")
+        else:
+            self._stream = self._raw
+
+        if self.output_format == "csv" and needs_header:
+            self._stream.write(b"index,password\n")
+
+    def write(self, password):
+        self.write_batch([password])
+
+    def write_batch(self, passwords):
+        if self.output_format == "plain":
+            text = '\n'.join(passwords) + '\n' if passwords else ''
+        else:
+            text = ''.join([format_password_line(password, index, self.output_format)
+                            for index, password in enumerate(passwords, self.written + 1)])
+        self._stream.write(text.encode("utf-8"))
+        self.written += len(passwords)
+
+    def write_bytes(self, data, count):
+        if self.output_format != "plain":
+            raise ValueError("Encoded password bytes can only be written in plain format")
+        self._stream.write(data)
+        self.written += count
+
+    def write_all(self, passwords):
+        start = self.written
+        passwords = iter(passwords)
+        while True:
+            batch = list(islice(passwords, self.batch_size))
+            if not batch:
+                break
+            self.write_batch(batch)
+        return self.written - start
+
+    def close(self, commit=True):
+        if self._stream is None:
+            return
+
+        stream, self._stream = self._stream, None
+        try:
+            if stream is not self._raw:
+                stream.close()
+            self._raw.flush()
+            if self.fsync and commit and self.path is not None:
+                os.fsync(self._raw.fileno())
+        except BaseException:
+            commit = False
+            raise
+        finally:
+            if self.path is not None:
+                self._raw.close()
+            if self._temp_path is not None:
+                self._finish_temp(commit)
+
+    def _finish_temp(self, commit):
+        temp_path, self._temp_path = self._temp_path, None
+        if not commit:
+            os.unlink(temp_path)
+            return
+        os.replace(temp_path, self.path)
+        if self.fsync:
+            fsync_directory(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
@@ -0,0 +1,208 @@
+import re
+from functools import lru_cache
+
+TOKEN_PATTERN = re.compile(r"\{\{|\}\}|\{([^{}]*)\}|[^{}]+|[{}]")
+RANGE_PATTERN = re.compile(r"^(-?\d+)(?:-(-?\d+))?$")
+CHAR_TYPES = {"l": "lowercase", "u": "uppercase", "d": "digits", "s": "special"}
+WORD_CASES = {"": None, "none": None, "cap": "capitalize", "upper": "uppercase",
+              "lower": "lowercase", "random": "random_case"}
+DEFAULT_SEPARATORS = ('-', '_', '.', '!', '@', '#')
+
+
+class FrozenDict(dict):
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Parsed template components are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def parse_range(text, field, single=False):
+    match = RANGE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid range '{text}' in '{{{field}}}'")
+    if single and match.group(2) is not None:
+        raise ValueError(f"Expected a single number, not the range '{text}', in '{{{field}}}'")
+    low = int(match.group(1))
+    high = int(match.group(2)) if match.group(2) is not None else low
+    return low, high
+
+
+def parse_field(field):
+    name, _, rest = field.partition(":")
+
+    if name == "sep":
+        return {"type": "separator", "options": list(rest or DEFAULT_SEPARATORS)}
+
+    args = rest.split(":") if rest else []
+    if name == "word" and len(args) <= 3:
+        config = {}
+        if args and args[0]:
+            config["min_length"], config["max_length"] = parse_range(args[0], field)
+        case = args[1] if len(args) > 1 else ""
+        if case not in WORD_CASES:
+            raise ValueError(f"Unknown word case '{case}' in '{{{field}}}'")
+        if WORD_CASES[case]:
+            config[WORD_CASES[case]] = True
+        if len(args) > 2 and args[2]:
+            pairs = [pair.split("=", 1) for pair in args[2].split(",")]
+            if any(len(pair) != 2 or not pair[0] for pair in pairs):
+                raise ValueError(f"Replacements must look like 'a=4,e=3' in '{{{field}}}'")
+            config["replacements"] = dict(pairs)
+        return {"type": "word", "config": config}
+
+    if name == "chars" and len(args) <= 2:
+        length = parse_range(args[0], field, single=True)[0] if args and args[0] else 4
+        types = args[1] if len(args) > 1 else "lud"
+        if not types or any(t not in CHAR_TYPES for t in types):
+            raise ValueError(f"Character types must be drawn from 'luds' in '{{{field}}}'")
+        return {"type": "random_chars",
+                "config": {"length": length, "types": [CHAR_TYPES[t] for t in types]}}
+
+    if name == "num" and len(args) <= 2:
+        config = {}
+        if args and args[0]:
+            config["min"], config["max"] = parse_range(args[0], field)
+        if len(args) > 1 and args[1]:
+            config["padding"] = parse_range(args[1], field, single=True)[0]
+        return {"type": "number", "config": config}
+
+    raise ValueError(f"Unknown template field '{{{field}}}'")
+
+
+@lru_cache(maxsize=256)
+def parse_template(template):
+    components = []
+    for match in TOKEN_PATTERN.finditer(template):
+        token = match.group(0)
+        if token in ("{{", "}}"):
+            components.append(FrozenDict(type="text", value=token[0]))
+        elif match.group(1) is not None:
+            components.append(freeze(parse_field(match.group(1))))
+        elif token in ("{", "}"):
+            raise ValueError(f"Unbalanced '{token}' at position {match.start()} in template")
+        else:
+            components.append(FrozenDict(type="text", value=token))
+    return tuple(components)
+
+
+def word_step(generator, config):
+    min_length = config.get('min_length', 3)
+    max_length = config.get('max_length', 10)
+    replacements = tuple(config.get('replacements', {}).items())
+
+    if config.get('capitalize', False):
+        transform = str.capitalize
+    elif config.get('uppercase', False):
+        transform = str.upper
+    elif config.get('lowercase', False):
+        transform = str.lower
+    else:
+        transform = None
+    random_case = transform is None and config.get('random_case', False)
+
+    def step(buffer):
+        word = generator.get_random_word(min_length, max_length, buffer.randbelow)
+        if transform is not None:
+            word = transform(word)
+        elif random_case:
+            word = ''.join(char.upper() if bit & 1 else char.lower()
+                           for char, bit in zip(word, buffer.read(len(word))))
+        for old, new in replacements:
+            word = word.replace(old, new)
+        return word
+
+    return step
+
+
+def chars_step(generator, config):
+    length = config.get('length', 4)
+    char_types = config.get('types', ['lowercase', 'uppercase', 'digits'])
+    plan = generator.get_charset_plan(
+        use_uppercase='uppercase' in char_types,
+        use_lowercase='lowercase' in char_types,
+        use_digits='digits' in char_types,
+        use_special='special' in char_types,
+        min_uppercase=0, min_lowercase=0, min_digits=0, min_special=0
+    )
+    if not plan.pool or length <= 0:
+        return None
+
+    pool, table = plan.pool, plan.pool_table
+    return lambda buffer: buffer.choices(pool, length, table)
+
+
+def number_step(config):
+    min_val = config.get('min', 0)
+    span = config.get('max', 9999) - min_val + 1
+    padding = config.get('padding', 0)
+    if span <= 0:
+        raise ValueError("Number range is empty")
+
+    if padding > 0:
+        return lambda buffer: str(buffer.randbelow(span) + min_val).zfill(padding)
+    return lambda buffer: str(buffer.randbelow(span) + min_val)
+
+
+def separator_step(options):
+    options = tuple(options)
+    if not options:
+        raise ValueError("Separator needs at least one option")
+    if len(options) == 1:
+        return options[0]
+    return lambda buffer: buffer.choice(options)
+
+
+def compile_steps(generator, components):
+    steps = []
+    for component in components:
+        comp_type = component.get('type', 'text')
+
+        if comp_type == 'text':
+            step = component.get('value', '')
+        elif comp_type == 'word':
+            step = word_step(generator, component.get('config', {}))
+        elif comp_type == 'random_chars':
+            step = chars_step(generator, component.get('config', {}))
+        elif comp_type == 'number':
+            step = number_step(component.get('config', {}))
+        elif comp_type == 'separator':
+            step = separator_step(component.get('options', DEFAULT_SEPARATORS))
+        else:
+            continue
+
+        if isinstance(step, str) and steps and isinstance(steps[-1], str):
+            steps[-1] += step
+        elif step:
+            steps.append(step)
+
+    return tuple((lambda buffer, text=step: text) if isinstance(step, str) else step for step in steps)
+
+
+class PasswordTemplate:
+    __slots__ = ("generator", "steps")
+
+    def __init__(self, generator, components):
+        self.generator = generator
+        self.steps = compile_steps(generator, components)
+
+    def generate(self):
+        buffer = self.generator.entropy_buffer(64)
+        return ''.join([step(buffer) for step in self.steps])
+
+    def generate_many(self, count, as_iterator=False, block_size=65536):
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        buffer = self.generator.entropy_buffer(block_size)
+        passwords = (''.join([step(buffer) for step in self.steps]) for _ in range(count))
+        return passwords if as_iterator else list(passwords)
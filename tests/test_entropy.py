@@ -0,0 +1,50 @@
+import math
+import os
+import sys
+from collections import defaultdict
+from itertools import product
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entropy import from_outcomes, random_case_distribution
+
+
+def enumerated_distribution(words, replacements):
+    outcomes = defaultdict(float)
+    for word in words:
+        variants = [''.join(chars) for chars in product(*((char.upper(), char.lower()) for char in word))]
+        for text in variants:
+            for old, new in replacements:
+                text = text.replace(old, new)
+            outcomes[text] += 1 / len(words) / len(variants)
+    return from_outcomes(outcomes)
+
+
+@pytest.mark.parametrize("words,replacements", [
+    (["apple", "seas", "kit"], ()),
+    (["polish", "Polish", "apple", "seas"], ()),
+    (["polish", "Polish", "apple", "seas"], (("a", "4"), ("e", "3"), ("s", "5"))),
+    (["base", "bAse", "b4se"], (("a", "4"),)),
+    (["straße", "cat"], ()),
+    (["abba", "ba"], (("ab", "x"),))
+])
+def test_random_case_matches_enumeration(words, replacements):
+    computed = random_case_distribution(words, replacements)
+    expected = enumerated_distribution(words, replacements)
+
+    assert computed.exact
+    assert computed.outcomes == expected.outcomes
+    assert computed.bits == pytest.approx(expected.bits)
+    assert computed.lengths == pytest.approx(expected.lengths)
+    assert computed.min_bits == pytest.approx(expected.min_bits)
+
+
+def test_random_case_estimates_large_non_positional_wordlists():
+    words = [f"{a}{b}{c}word{d}" for a, b, c, d in product("abcdefghij", repeat=4)]
+    distribution = random_case_distribution(words, (("ab", "x"),))
+
+    assert not distribution.exact
+    assert distribution.result().outcomes is None
+    assert distribution.bits == pytest.approx(math.log2(len(words)) + 8, abs=0.01)
@@ -0,0 +1,52 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator
+
+
+def seeded_output(metrics):
+    gen = PasswordGenerator(random_backend="seeded", seed=5)
+    if metrics:
+        gen.enable_metrics()
+    passwords = [gen.generate_memorable_password() for _ in range(50)]
+    passwords += [gen.generate_password(16) for _ in range(50)]
+    passwords += gen.generate_passwords(1000)
+    return passwords, gen.metrics
+
+
+def test_metrics_do_not_change_seeded_output():
+    plain, _ = seeded_output(False)
+    counted, metrics = seeded_output(True)
+
+    assert counted == plain
+    assert metrics.counters["entropy_bytes_fetched"] > 0
+
+
+def test_entropy_is_counted_as_consumed_per_method():
+    gen = PasswordGenerator(random_backend="seeded", seed=5)
+    metrics = gen.enable_metrics()
+
+    gen.generate_password(12)
+    single = metrics.snapshot()["methods"]["generate_password"]["entropy_bytes"]
+    assert 12 <= single < 64
+
+    gen.generate_password_by_complexity(10)
+    methods = metrics.snapshot()["methods"]
+    nested = methods["generate_password_by_complexity"]["entropy_bytes"]
+    assert nested > 0
+    assert methods["generate_password"]["entropy_bytes"] == single + nested
+
+
+def test_lazy_iterators_are_counted_when_consumed():
+    gen = PasswordGenerator(random_backend="seeded", seed=5)
+    metrics = gen.enable_metrics()
+
+    passwords = gen.generate_passwords(1000, as_iterator=True, length=16)
+    assert metrics.snapshot()["methods"]["generate_passwords"]["entropy_bytes"] == 0
+    assert len(list(passwords)) == 1000
+
+    consumed = metrics.snapshot()["methods"]["generate_passwords"]["entropy_bytes"]
+    assert 16000 <= consumed < 65536
+    assert f'method="generate_passwords"}} {consumed}' in metrics.render_text()
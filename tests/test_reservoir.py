@@ -0,0 +1,51 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator
+from reservoir import PasswordReservoir
+
+
+@pytest.mark.parametrize("backend,seed", [("stream", None), ("seeded", 7)])
+def test_concurrent_takes_and_refills_never_repeat(backend, seed):
+    taken = []
+    generator = PasswordGenerator(random_backend=backend, seed=seed)
+    with PasswordReservoir(generator, capacity=64, low_water=63, refill_batch=8) as reservoir:
+        reservoir.register("default", length=16)
+
+        def take_many():
+            taken.extend([reservoir.take("default") for _ in range(5000)])
+
+        threads = [threading.Thread(target=take_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(taken) == 20000
+    assert len(set(taken)) == len(taken)
+
+
+@pytest.mark.parametrize("low_water", [-1, 64, 100])
+def test_low_water_must_be_below_capacity(low_water):
+    with pytest.raises(ValueError):
+        PasswordReservoir(capacity=64, low_water=low_water)
+
+
+def test_miss_does_not_wait_for_a_whole_refill():
+    with PasswordReservoir(capacity=20000) as reservoir:
+        reservoir.register_complexity(10, prefill=False)
+        reservoir.register("default", prefill=False)
+        time.sleep(0.01)
+
+        start = time.perf_counter()
+        reservoir.take("default")
+        elapsed = time.perf_counter() - start
+        assert reservoir.stats()["complexity:10"]["size"] < 20000
+
+    assert elapsed < 0.05
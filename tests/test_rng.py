@@ -0,0 +1,53 @@
+import os
+import random
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator, RandomSourceAdapter, create_random_source
+from rng import SeededRandomSource, StreamRandomSource
+
+
+def draw_concurrently(draw, threads=8, calls=5000):
+    results = []
+
+    def run():
+        results.extend([draw() for _ in range(calls)])
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+@pytest.mark.parametrize("source", [StreamRandomSource(block_size=4096), SeededRandomSource(3, block_size=4096)])
+def test_stream_sources_never_repeat_across_threads(source):
+    results = draw_concurrently(lambda: source.randbytes(16) + bytes([source.randbelow(200)]))
+    assert len(set(result[:16] for result in results)) == len(results)
+
+
+def test_shared_stream_generator_never_repeats_across_threads():
+    gen = PasswordGenerator(random_backend="stream")
+    passwords = draw_concurrently(lambda: gen.generate_password(16))
+    assert len(set(passwords)) == len(passwords)
+
+
+def test_seeded_stream_is_reproducible():
+    first, second = SeededRandomSource(9), SeededRandomSource(9)
+    assert [first.randbelow(1000) for _ in range(100)] == [second.randbelow(1000) for _ in range(100)]
+    assert first.randbytes(64) == second.randbytes(64)
+
+
+def test_plain_random_instances_are_adapted():
+    source = create_random_source(random.Random(1))
+    assert isinstance(source, RandomSourceAdapter)
+
+    gen = PasswordGenerator(random_backend=random.Random(1))
+    again = PasswordGenerator(random_backend=random.Random(1))
+    assert gen.generate_memorable_password() == again.generate_memorable_password()
+    assert gen.generate_password(16) == again.generate_password(16)
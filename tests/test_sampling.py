@@ -0,0 +1,115 @@
+import math
+import os
+import sys
+from collections import Counter
+from itertools import product
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator, PasswordSampler
+
+REJECTION_OPTIONS = {"length": 4, "use_uppercase": False, "use_special": False,
+                     "min_uppercase": 0, "min_special": 0}
+COMPOSITION_OPTIONS = {"length": 4}
+SAMPLES_PER_PASSWORD = 40
+
+
+def narrowed_generator(**kwargs):
+    gen = PasswordGenerator(**kwargs)
+    gen.lowercase = "abc"
+    gen.uppercase = "D"
+    gen.digits = "01"
+    gen.special_chars = "!"
+    return gen
+
+
+def use_sampler(gen, path, options):
+    sampler = gen.get_password_sampler(**options)
+    if path == "composition" and sampler.label_table is not None:
+        sampler = PasswordSampler(sampler.plan, sampler.length)
+        sampler.label_table = None
+        gen.get_password_sampler = lambda *args, **kwargs: sampler
+    return sampler
+
+
+def valid_passwords(sampler):
+    return {
+        ''.join(chars) for chars in product(sampler.plan.pool, repeat=sampler.length)
+        if all(sum(char in members for char in chars) >= minimum for members, minimum in sampler.plan.classes)
+    }
+
+
+def chi_square_limit(df, z=5.0):
+    return df * (1 - 2 / (9 * df) + z * math.sqrt(2 / (9 * df))) ** 3
+
+
+def split_lines(data):
+    return bytes(data).decode("ascii").split("\n")[:-1]
+
+
+GENERATORS = {
+    "generate_passwords": lambda gen, count, options: gen.generate_passwords(count, **options),
+    "generate_password": lambda gen, count, options: [gen.generate_password(**options) for _ in range(count)],
+    "generate_password_bytes": lambda gen, count, options: split_lines(gen.generate_password_bytes(count, **options)),
+    "iter_password_bytes": lambda gen, count, options: split_lines(
+        b"".join(gen.iter_password_bytes(count, chunk_size=1000, **options)))
+}
+
+CASES = [
+    ("rejection", REJECTION_OPTIONS),
+    ("composition", REJECTION_OPTIONS),
+    ("composition", COMPOSITION_OPTIONS)
+]
+
+
+def test_cases_cover_both_sampling_paths():
+    gen = narrowed_generator()
+    assert gen.get_password_sampler(**REJECTION_OPTIONS).label_table is not None
+    assert gen.get_password_sampler(**COMPOSITION_OPTIONS).label_table is None
+
+
+@pytest.mark.parametrize("method", GENERATORS)
+@pytest.mark.parametrize("path,options", CASES)
+def test_output_is_uniform_over_valid_passwords(method, path, options):
+    gen = narrowed_generator()
+    sampler = use_sampler(gen, path, options)
+    valid = valid_passwords(sampler)
+    assert len(valid) == sampler.count
+
+    passwords = GENERATORS[method](gen, SAMPLES_PER_PASSWORD * len(valid), options)
+    counts = Counter(passwords)
+    assert set(counts) == valid
+
+    expected = len(passwords) / len(valid)
+    statistic = sum((counts[password] - expected) ** 2 / expected for password in valid)
+    assert statistic < chi_square_limit(len(valid) - 1)
+
+
+@pytest.mark.parametrize("options", [
+    {"length": 8, "min_uppercase": 2, "min_lowercase": 2, "min_digits": 2, "min_special": 2},
+    {"length": 16, "min_uppercase": 3, "min_lowercase": 1, "min_digits": 4, "min_special": 2},
+    {"length": 12, "exclude_ambiguous": True}
+])
+def test_generate_passwords_meets_class_minimums(options):
+    gen = PasswordGenerator()
+    classes = gen.get_password_sampler(**options).plan.classes
+
+    for password in gen.generate_passwords(2000, **options):
+        assert len(password) == options["length"]
+        for members, minimum in classes:
+            assert sum(char in members for char in password) >= minimum
+
+
+@pytest.mark.parametrize("path,options", CASES + [("rejection", {"length": 16}),
+                                                  ("composition", {"length": 16})])
+def test_seeded_bytes_output_matches_str_output(path, options):
+    outputs = []
+    for method in ("generate_passwords", "generate_password_bytes", "iter_password_bytes"):
+        gen = narrowed_generator(random_backend="seeded", seed=20) if options["length"] == 4 else \
+            PasswordGenerator(random_backend="seeded", seed=20)
+        use_sampler(gen, path, options)
+        outputs.append(GENERATORS[method](gen, 5000, options))
+
+    assert outputs[0] == outputs[1] == outputs[2]
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parallel
+import server
+from server import PasswordService
+
+
+@pytest.fixture
+def service():
+    parallel._init_worker()
+    service = PasswordService(workers=1, chunk_size=10)
+    service.executor.shutdown()
+    service.executor = ThreadPoolExecutor(max_workers=2)
+    yield service
+    service.close()
+
+
+def exchange(service, request):
+    async def run():
+        listener = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+
+    return asyncio.run(run())
+
+
+def get(service, target):
+    return exchange(service, f"GET {target} HTTP/1.1\r\nConnection: close\r\n\r\n".encode("ascii"))
+
+
+def json_body(response):
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split(b" ")[1]), json.loads(body)
+
+
+def test_generate_runs_in_the_executor(service):
+    status, body = json_body(get(service, "/generate?length=20"))
+    assert status == 200
+    assert len(body["password"]) == 20
+
+
+@pytest.mark.parametrize("target", [
+    "/generate?length=1000000",
+    "/entropy?length=5000000",
+    "/generate?type=memorable&num_words=100000",
+    "/generate?type=custom&components=%7Bchars:100000%7D",
+    "/generate/bulk?count=2&length=100000"
+])
+def test_oversized_jobs_are_rejected(service, target):
+    status, body = json_body(get(service, target))
+    assert status == 400
+    assert "at most" in body["error"]
+
+
+def test_bulk_failure_after_head_closes_the_connection(service, monkeypatch):
+    calls = []
+    lock = threading.Lock()
+
+    def failing_chunk(kind, size, options):
+        with lock:
+            calls.append(size)
+            if len(calls) == 3:
+                raise ValueError("worker failed")
+        return ["x"] * size
+
+    monkeypatch.setattr(server, "_generate_chunk", failing_chunk)
+    response = get(service, "/generate/bulk?count=1000")
+
+    assert response.startswith(b"HTTP/1.1 200 OK")
+    assert response.count(b"HTTP/1.1") == 1
+    assert not response.endswith(b"0\r\n\r\n")
+    assert len(calls) < 100
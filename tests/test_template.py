@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PasswordGenerator
+from template import parse_template
+
+TEMPLATE = "{word:4-8:cap:a=4,o=0}{sep:-_}{chars:6:ld}{num:-5-99:3}"
+COMPONENTS = [
+    {"type": "word", "config": {"min_length": 4, "max_length": 8, "capitalize": True,
+                                "replacements": {"a": "4", "o": "0"}}},
+    {"type": "separator", "options": ["-", "_"]},
+    {"type": "random_chars", "config": {"length": 6, "types": ["lowercase", "digits"]}},
+    {"type": "number", "config": {"min": -5, "max": 99, "padding": 3}}
+]
+
+
+def test_escaped_braces_are_literal_text():
+    components = parse_template("a{{b}}c{num:1-2}")
+    assert ''.join(c["value"] for c in components if c["type"] == "text") == "a{b}c"
+    assert PasswordGenerator().build_custom_password("{{{num:7}}}") == "{7}"
+
+
+@pytest.mark.parametrize("template", [
+    "{bogus}", "{word:4-8:shout}", "{word:x}", "{chars:4:lqz}", "{chars:4:}", "{num:1-2:3:4}",
+    "{word:4:cap:a4}", "{unclosed", "stray}", "{chars:4-8}", "{num:0-9:3-5}"
+])
+def test_bad_fields_are_rejected(template):
+    with pytest.raises(ValueError):
+        parse_template(template)
+
+
+@pytest.mark.parametrize("template,config", [
+    ("{word:5}", {"min_length": 5, "max_length": 5}),
+    ("{word:3-9}", {"min_length": 3, "max_length": 9}),
+    ("{num:-10--2}", {"min": -10, "max": -2}),
+    ("{num:42}", {"min": 42, "max": 42}),
+    ("{num:0-999:3}", {"min": 0, "max": 999, "padding": 3}),
+    ("{chars:12}", {"length": 12, "types": ("lowercase", "uppercase", "digits")})
+])
+def test_ranges(template, config):
+    assert parse_template(template)[0]["config"] == config
+
+
+def test_parsed_components_match_component_dicts():
+    parsed = parse_template(TEMPLATE)
+    assert json.loads(json.dumps(parsed)) == COMPONENTS
+
+    from_template = PasswordGenerator(random_backend="seeded", seed=11)
+    from_dicts = PasswordGenerator(random_backend="seeded", seed=11)
+    assert (from_template.compile_template(TEMPLATE).generate_many(200) ==
+            from_dicts.compile_template(COMPONENTS).generate_many(200))
+    assert (from_template.password_entropy("custom", components=TEMPLATE) ==
+            from_dicts.password_entropy("custom", components=COMPONENTS))
+
+
+def test_cached_components_are_read_only():
+    components = parse_template(TEMPLATE)
+    with pytest.raises(TypeError):
+        components[0]["config"]["min_length"] = 1
+    with pytest.raises(TypeError):
+        components[0]["config"]["replacements"].update(e="3")
+    assert parse_template(TEMPLATE)[0]["config"]["min_length"] == 4
@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+import warnings
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from entropy import GeneratorEntropy
+from main import PasswordGenerator
+from unique import BirthdayBoundWarning, FingerprintSet, UniquenessPlan, iter_unique
+
+
+def test_fingerprint_set_grows_and_keeps_members():
+    seen = FingerprintSet(16)
+    initial = seen.nbytes
+    passwords = [f"password-{i}" for i in range(5000)]
+
+    assert all(seen.add(password) for password in passwords)
+    assert not any(seen.add(password) for password in passwords)
+    assert len(seen) == 5000
+    assert seen.nbytes > initial
+    assert all(password in seen for password in passwords)
+    assert "password-5000" not in seen
+
+
+def test_fingerprint_set_probes_past_colliding_slots():
+    seen = FingerprintSet(1024)
+    size = len(seen._table)
+    colliding = [size * k for k in range(1, 50)]
+
+    assert all(seen.add(value) for value in colliding)
+    assert all(value in seen for value in colliding)
+    assert size * 50 not in seen
+    assert not seen.add(size * 7)
+
+
+def test_exact_space_can_be_exhausted():
+    gen = PasswordGenerator()
+    with pytest.warns(BirthdayBoundWarning):
+        passwords = gen.generate_unique_passwords(100, kind="custom", components="{num:0-99}")
+    assert sorted(map(int, passwords)) == list(range(100))
+
+    with pytest.raises(ValueError):
+        gen.generate_unique_passwords(101, kind="custom", components="{num:0-99}")
+
+
+def test_strict_mode_enforces_the_birthday_bound():
+    entropy = GeneratorEntropy(20.0, 20.0, False)
+    with pytest.raises(ValueError):
+        UniquenessPlan(10000, entropy).check(strict=True)
+    with pytest.warns(BirthdayBoundWarning):
+        UniquenessPlan(10000, entropy).check()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        UniquenessPlan(10, entropy).check(strict=True)
+
+    with pytest.raises(ValueError):
+        PasswordGenerator().generate_unique_passwords(5000, kind="custom", components="{num:0-99999}",
+                                                      strict=True)
+
+
+def test_redraws_give_up_when_nothing_new_appears():
+    with pytest.raises(ValueError):
+        list(iter_unique(lambda size: ["same"] * size, 2, max_redraws=10))
+
+
+def test_long_passwords_do_not_overflow_the_bound():
+    plan = UniquenessPlan(10 ** 6, PasswordGenerator().password_entropy("standard", length=300))
+    assert plan.check(strict=True).collision_probability == 0.0
+
+    result = subprocess.run([sys.executable, "main.py", "generate", "--length", "300", "--count", "3",
+                             "--unique", "strict"], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    passwords = result.stdout.split()
+    assert len(passwords) == 3
+    assert all(len(password) == 300 for password in passwords)
@@ -0,0 +1,162 @@
+import math
+import warnings
+from array import array
+
+FINGERPRINT_MASK = (1 << 64) - 1
+MAX_LOAD = 0.75
+REFILL_BATCH = 256
+
+
+class BirthdayBoundWarning(UserWarning):
+    pass
+
+
+class FingerprintSet:
+    __slots__ = ("_table", "_mask", "_limit", "count")
+
+    def __init__(self, capacity=1024):
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        size = 1 << max(4, math.ceil(math.log2(max(1, capacity) / MAX_LOAD)))
+        self._table = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._limit = int(size * MAX_LOAD)
+
+    def add(self, password):
+        fingerprint = hash(password) & FINGERPRINT_MASK or 1
+        table, mask = self._table, self._mask
+        index = fingerprint & mask
+        while table[index]:
+            if table[index] == fingerprint:
+                return False
+            index = (index + 1) & mask
+
+        table[index] = fingerprint
+        self.count += 1
+        if self.count > self._limit:
+            self._grow()
+        return True
+
+    def _grow(self):
+        old = self._table
+        self._allocate(2 * len(old))
+        table, mask = self._table, self._mask
+        for fingerprint in old:
+            if fingerprint:
+                index = fingerprint & mask
+                while table[index]:
+                    index = (index + 1) & mask
+                table[index] = fingerprint
+
+    def __contains__(self, password):
+        fingerprint = hash(password) & FINGERPRINT_MASK or 1
+        table, mask = self._table, self._mask
+        index = fingerprint & mask
+        while table[index]:
+            if table[index] == fingerprint:
+                return True
+            index = (index + 1) & mask
+        return False
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        return self._table.itemsize * len(self._table)
+
+
+class UniquenessPlan:
+    __slots__ = ("count", "outcomes", "space_bits", "expected_duplicates", "collision_probability")
+
+    def __init__(self, count, entropy=None):
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+        self.count = count
+        if entropy is None:
+            self.outcomes = None
+            self.space_bits = None
+            self.expected_duplicates = None
+            self.collision_probability = None
+            return
+
+        self.outcomes = entropy.outcomes if entropy.exact else None
+        self.space_bits = entropy.bits
+        exponent = 2 * math.log2(count) - 1 - entropy.min_bits if count > 1 else -math.inf
+        self.expected_duplicates = 2.0 ** exponent if exponent < 1024 else math.inf
+        self.collision_probability = -math.expm1(-self.expected_duplicates)
+
+    @property
+    def capacity(self):
+        if self.outcomes is None:
+            return self.count
+        return min(self.count, self.outcomes)
+
+    def check(self, strict=False, max_collision_probability=0.01):
+        if self.space_bits is None:
+            return self
+
+        if self.outcomes is not None and self.count > self.outcomes:
+            raise ValueError(f"Only {self.outcomes:,} distinct passwords exist for this configuration, "
+                             f"cannot produce {self.count:,} unique ones")
+        if self.outcomes is None and self.count and math.log2(self.count) > self.space_bits:
+            warnings.warn(f"{self.count:,} passwords may exceed the roughly 2^{self.space_bits:.1f} distinct "
+                          f"passwords this configuration can produce", BirthdayBoundWarning, stacklevel=4)
+
+        if self.collision_probability > max_collision_probability:
+            message = (f"{self.count:,} passwords from a space of about 2^{self.space_bits:.1f} "
+                       f"is past the birthday bound ({self.collision_probability:.1%} chance of a repeat); "
+                       f"use a longer or richer configuration")
+            if strict:
+                raise ValueError(message)
+            warnings.warn(message, BirthdayBoundWarning, stacklevel=4)
+        return self
+
+
+def iter_unique(draw, count, seen=None, max_redraws=1000):
+    seen = FingerprintSet(count) if seen is None else seen
+    emitted = 0
+    redraws = 0
+    size = count
+
+    while emitted < count:
+        passwords = draw(size)
+        try:
+            for password in passwords:
+                if not seen.add(password):
+                    redraws += 1
+                    if redraws > max_redraws:
+                        raise ValueError(f"Gave up after {max_redraws} repeated passwords in a row, "
+                                         f"the configuration is nearly exhausted")
+                    continue
+
+                redraws = 0
+                emitted += 1
+                yield password
+                if emitted == count:
+                    break
+        finally:
+            close = getattr(passwords, "close", None)
+            if close is not None:
+                close()
+        size = max(count - emitted, REFILL_BATCH)
+
+
+def configuration_entropy(generator, kind, options):
+    try:
+        return generator.password_entropy(kind, **options)
+    except ValueError:
+        return None
+
+
+def unique_passwords(generator, kind, count, options, draw=None, strict=False, max_redraws=1000):
+    from main import iter_password_job
+
+    plan = UniquenessPlan(count, configuration_entropy(generator, kind, options)).check(strict)
+    if plan.outcomes is not None:
+        max_redraws = max(max_redraws, 20 * plan.outcomes // (plan.outcomes - plan.capacity + 1))
+    if draw is None:
+        draw = lambda size: iter_password_job(generator, kind, size, options)
+    return iter_unique(draw, count, FingerprintSet(plan.capacity), max_redraws)
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+
+
+class WordBatch:
+    __slots__ = ("words", "complete", "draws")
+
+    def __init__(self, words, complete):
+        self.words = words
+        self.complete = complete
+        self.draws = 0
+
+
+class WordCache:
+    def __init__(self, fetch, batch_size=65536, max_words=262144):
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+        if max_words < batch_size:
+            raise ValueError("The cache must hold at least one batch")
+
+        self.fetch = fetch
+        self.batch_size = batch_size
+        self.max_words = max_words
+        self.batches = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def choice(self, min_length, max_length, randbelow):
+        key = (min_length, max_length)
+        batch = self.batches.get(key)
+        if batch is None:
+            self.misses += 1
+            batch = self._load(key)
+        elif not batch.complete and batch.draws >= len(batch.words):
+            self.refreshes += 1
+            self._discard(key)
+            batch = self._load(key)
+        else:
+            self.hits += 1
+            self.batches.move_to_end(key)
+
+        if not batch.words:
+            return None
+        batch.draws += 1
+        return batch.words[randbelow(len(batch.words))]
+
+    def _load(self, key):
+        words = tuple(self.fetch(key[0], key[1], self.batch_size))
+        batch = WordBatch(words, len(words) < self.batch_size)
+
+        while self.batches and self.size + len(words) > self.max_words:
+            self._discard(next(iter(self.batches)))
+            self.evictions += 1
+
+        self.batches[key] = batch
+        self.size += len(words)
+        return batch
+
+    def _discard(self, key):
+        self.size -= len(self.batches.pop(key).words)
+
+    def clear(self):
+        self.batches.clear()
+        self.size = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses + self.refreshes
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "keys": len(self.batches),
+            "words": self.size
+        }
+
+
+def wonderwords_fetcher(backend):
+    def fetch(min_length, max_length, amount):
+        return backend.random_words(amount=amount, word_min_length=min_length, word_max_length=max_length,
+                                    return_less_if_necessary=True)
+
+    return fetch
@@ -0,0 +1,107 @@
+import mmap
+import secrets
+import struct
+
+MAGIC = b"PWWL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+OFFSET = struct.Struct("<I")
+
+
+def read_words(source_path, min_length=1, max_length=64):
+    words = set()
+    with open(source_path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            word = fields[-1]
+            if min_length <= len(word) <= max_length:
+                words.add(word)
+    return words
+
+
+def build_wordlist(source_path, output_path, min_length=1, max_length=64):
+    words = sorted(read_words(source_path, min_length, max_length), key=lambda w: (len(w), w))
+    if not words:
+        raise ValueError("No usable words in source")
+
+    longest = len(words[-1])
+    length_offsets = []
+    position = 0
+    for length in range(longest + 2):
+        while position < len(words) and len(words[position]) < length:
+            position += 1
+        length_offsets.append(position)
+
+    encoded = [word.encode("utf-8") for word in words]
+    word_offsets = [0]
+    for data in encoded:
+        word_offsets.append(word_offsets[-1] + len(data))
+
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(words), longest))
+        f.write(struct.pack(f"<{len(length_offsets)}I", *length_offsets))
+        f.write(struct.pack(f"<{len(word_offsets)}I", *word_offsets))
+        for data in encoded:
+            f.write(data)
+
+    return len(words)
+
+
+class MappedWordList:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.word_count, self.max_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a wordlist file: {path}")
+        if version != VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported wordlist version: {version}")
+
+        self._length_table = HEADER.size
+        self._word_table = self._length_table + (self.max_length + 2) * OFFSET.size
+        self._data = self._word_table + (self.word_count + 1) * OFFSET.size
+        self.path = path
+
+    def __len__(self):
+        return self.word_count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.word_count:
+            raise IndexError("Word index out of range")
+        start, end = struct.unpack_from("<II", self._map, self._word_table + index * OFFSET.size)
+        return self._map[self._data + start:self._data + end].decode("utf-8")
+
+    def __iter__(self):
+        for index in range(self.word_count):
+            yield self[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def _offset(self, length):
+        if length <= 0:
+            return 0
+        if length > self.max_length:
+            return self.word_count
+        return OFFSET.unpack_from(self._map, self._length_table + length * OFFSET.size)[0]
+
+    def count(self, min_length, max_length):
+        return max(0, self._offset(max_length + 1) - self._offset(min_length))
+
+    def choice(self, min_length, max_length, randbelow=secrets.randbelow):
+        start = self._offset(min_length)
+        size = self._offset(max_length + 1) - start
+        if size <= 0:
+            return None
+        return self[start + randbelow(size)]